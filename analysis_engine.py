@@ -127,6 +127,17 @@ except ImportError:
     SCIPY_AVAILABLE = False
     logger.warning("⚠️ SciPy not available. Some statistical features will be limited.")
 
+# Try to import numba to JIT-compile the slip math
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit: returns the function unchanged"""
+        return lambda func: func
+
 # Try to import config
 try:
     from config import Config
@@ -136,6 +147,35 @@ except ImportError:
     logger.warning("⚠️ Config module not available. Using default settings.")
 
 
+@njit(cache=True, fastmath=True)
+def compute_slip(true_probs: np.ndarray, bet_is_over: np.ndarray, probability_edges: np.ndarray,
+                 tier_multipliers: np.ndarray, stake: float) -> Tuple[float, float, float]:
+    """Return (slip probability, multiplier, expected value) for one all-must-hit slip
+    
+    The multiplier is tier_multipliers[i], where i is how many probability_edges
+    the slip probability is above.
+    """
+    pick_probs = np.where(bet_is_over, true_probs, 1.0 - true_probs)
+    slip_probability = np.prod(pick_probs)
+    multiplier = tier_multipliers[np.searchsorted(probability_edges, slip_probability)]
+    return slip_probability, multiplier, slip_probability * multiplier * stake - stake
+
+
+@njit(cache=True, fastmath=True)
+def compute_slips(true_probs: np.ndarray, bet_is_over: np.ndarray, probability_edges: np.ndarray,
+                  tier_multipliers: np.ndarray, stake: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Price every row of (slips, picks) arrays with compute_slip, one value per slip out"""
+    slip_count = true_probs.shape[0]
+    slip_probabilities = np.empty(slip_count)
+    multipliers = np.empty(slip_count)
+    expected_values = np.empty(slip_count)
+    for i in range(slip_count):
+        slip_probabilities[i], multipliers[i], expected_values[i] = compute_slip(
+            true_probs[i], bet_is_over[i], probability_edges, tier_multipliers, stake
+        )
+    return slip_probabilities, multipliers, expected_values
+
+
 @dataclass
 class AnalysisConfig:
     """Configuration class for analysis parameters"""
@@ -4,15 +4,47 @@ import time
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from config import Config
+from http_session import SESSION
 import logging
 
+# orjson parses the nested bookmaker/market payloads in native code
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+def decode_json(response: requests.Response):
+    """Decode a JSON response body, via orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
 class MultiAPIDataFetcher:
     """Enhanced data fetcher that uses ALL your configured APIs"""
     
-    def __init__(self):
+    ODDS_API_URL = "https://api.the-odds-api.com/v4/sports/{sport_key}/odds"
+    
+    # The Odds API sport keys and the player markets requested for each sport
+    ODDS_SPORT_KEYS = {
+        'MLB': 'baseball_mlb',
+        'NFL': 'americanfootball_nfl',
+        'NBA': 'basketball_nba',
+        'NHL': 'icehockey_nhl'
+    }
+    ODDS_MARKETS = {
+        'MLB': 'player_hits,player_runs,player_rbis,player_home_runs,player_strikeouts',
+        'NFL': 'player_passing_yards,player_rushing_yards,player_receiving_yards',
+        'NBA': 'player_points,player_rebounds,player_assists',
+        'NHL': 'player_points,player_assists'
+    }
+    
+    def __init__(self, session: Optional[requests.Session] = None):
         self.config = Config()
+        # Shared keep-alive session so repeated lookups reuse the TLS connection
+        self.session = session if session is not None else SESSION
         self.rate_limit_delay = self.config.REQUEST_DELAY
         self.last_request_time = {}  # Track last request time per API
         
@@ -168,8 +200,7 @@ class MultiAPIDataFetcher:
         
         headers = {
             "X-RapidAPI-Key": api_key,
-            "X-RapidAPI-Host": api_host,
-            "User-Agent": "PropBot/2.0"
+            "X-RapidAPI-Host": api_host
         }
         
         # Enhanced parameters based on API
@@ -177,7 +208,7 @@ class MultiAPIDataFetcher:
         
         try:
             print(f"🌐 Making API request to {api_sport_key}: {endpoint}")
-            response = requests.get(endpoint, headers=headers, params=params, timeout=15)
+            response = self.session.get(endpoint, headers=headers, params=params, timeout=15)
             
             # Update rate limit tracking
             self.last_request_time[api_host] = time.time()
@@ -185,7 +216,7 @@ class MultiAPIDataFetcher:
             print(f"📡 {api_sport_key} API Response: {response.status_code}")
             
             if response.status_code == 200:
-                data = response.json()
+                data = decode_json(response)
                 print(f"✅ {api_sport_key} API data received for {player_name}")
                 return self._process_api_response(data, api_sport_key)
             elif response.status_code == 429:
@@ -547,6 +578,45 @@ class MultiAPIDataFetcher:
         
         return base_data
     
+    def fetch_sportsbook_odds_batch(self, sport: str, player_names: List[str]) -> Dict[str, Dict]:
+        """Fetch sportsbook odds for many players of one sport in a single request"""
+        sport_key = self.ODDS_SPORT_KEYS.get(sport.upper())
+        if not sport_key or not player_names:
+            return {}
+        
+        response = self.session.get(
+            self.ODDS_API_URL.format(sport_key=sport_key),
+            params={
+                'apiKey': self.config.ODDS_API_KEY,
+                'regions': 'us',
+                'markets': self.ODDS_MARKETS[sport.upper()],
+                'oddsFormat': 'american'
+            },
+            timeout=15
+        )
+        response.raise_for_status()
+        
+        # Split each bookmaker's markets down to the outcomes for each wanted player
+        wanted = {name.lower(): name for name in player_names}
+        odds_by_player = {}
+        for event in decode_json(response):
+            for bookmaker in event.get('bookmakers', []):
+                per_player = {}
+                for market in bookmaker.get('markets', []):
+                    for outcome in market.get('outcomes', []):
+                        name = wanted.get((outcome.get('description') or '').lower())
+                        if name:
+                            markets = per_player.setdefault(name, {})
+                            markets.setdefault(market.get('key'), []).append(outcome)
+                
+                for name, markets in per_player.items():
+                    odds_by_player.setdefault(name, {'bookmakers': []})['bookmakers'].append({
+                        'title': bookmaker.get('title', 'unknown'),
+                        'markets': [{'key': key, 'outcomes': outcomes} for key, outcomes in markets.items()]
+                    })
+        
+        return odds_by_player
+    
     def get_available_apis_for_sport(self, sport: str) -> List[str]:
         """Get list of available APIs for a sport"""
         return self.api_priority.get(sport.upper(), [])
@@ -558,7 +628,7 @@ class MultiAPIDataFetcher:
         for sport, config in self.config.SUPPORTED_SPORTS.items():
             try:
                 # Make a simple test request
-                response = requests.get(
+                response = self.session.get(
                     config['endpoint'],
                     headers={
                         'X-RapidAPI-Key': config['api_key'],
@@ -580,6 +650,10 @@ class MultiAPIDataFetcher:
         return results
 
 
+# Name used by main.py
+RapidAPIDataFetcher = MultiAPIDataFetcher
+
+
 # Test function
 if __name__ == "__main__":
     print("🧪 Testing Multi-API Data Fetcher...")
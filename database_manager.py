@@ -1,43 +1,164 @@
 import sqlite3
 import pandas as pd
 import os
+import atexit
+import itertools
+import threading
+from contextlib import closing, contextmanager
 from config import Config
 
+INSERT_PROP_SQL = """
+    INSERT INTO props (sport, player_name, prop_type, line_value, bet_type, odds, raw_input)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Secondary indexes on props (name -> column); dropped during bulk imports and rebuilt afterwards
+PROP_INDEX_COLUMNS = {
+    "idx_player": "player_name",
+    "idx_sport": "sport",
+}
+PROP_INDEXES = tuple(
+    f"CREATE INDEX IF NOT EXISTS {name} ON props({column})"
+    for name, column in PROP_INDEX_COLUMNS.items()
+)
+
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS props (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        sport TEXT NOT NULL,
+        player_name TEXT NOT NULL,
+        prop_type TEXT NOT NULL,
+        line_value REAL NOT NULL,
+        bet_type TEXT,
+        odds TEXT,
+        raw_input TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        analyzed BOOLEAN DEFAULT FALSE,
+        recommended BOOLEAN DEFAULT FALSE,
+        confidence_score REAL
+    );
+""" + "".join(f"    {index_sql};\n" for index_sql in PROP_INDEXES)
+
+UPDATE_ANALYSIS_SQL = """
+    UPDATE props
+    SET analyzed = TRUE,
+        recommended = ?,
+        confidence_score = ?
+    WHERE id = ?
+"""
+
+# WAL journaling with relaxed sync: one append + fsync per commit instead of
+# the rollback journal's multiple fsyncs, and readers no longer block writers.
+# synchronous/temp_store/cache_size are per-connection, so apply on every open.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+# Read-only connections served round-robin to SELECT queries
+READER_CONNECTIONS = 2
+
+# Rows per executemany call when importing prop archives
+IMPORT_CHUNK_SIZE = 10_000
+
+def connect_props_db(path, **kwargs):
+    """Open a SQLite connection with the standard performance PRAGMAs applied"""
+    conn = sqlite3.connect(path, **kwargs)
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
 class DatabaseManager:
+    """Process-wide owner of the props database connections"""
+    
+    _instance = None
+    _instance_lock = threading.Lock()
+    
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+            return cls._instance
+    
     def __init__(self):
+        if self._initialized:
+            return
         self.props_db = Config.PROPS_DB
         self.stats_db = Config.STATS_DB
+        self._insert_sql = INSERT_PROP_SQL
+        
+        # Connections live for the whole process so the .db/-wal/-shm files
+        # are opened once rather than on every query.
+        os.makedirs(Config.DATABASE_PATH, exist_ok=True)
+        self._rw = connect_props_db(self.props_db, isolation_level=None,
+                                    check_same_thread=False)
+        self._write_lock = threading.RLock()
         self.init_databases()
+        
+        reader_uri = f"file:{os.path.abspath(self.props_db)}?mode=ro"
+        self._readers = [
+            (connect_props_db(reader_uri, uri=True, check_same_thread=False), threading.Lock())
+            for _ in range(READER_CONNECTIONS)
+        ]
+        self._reader_cycle = itertools.cycle(self._readers)
+        
+        atexit.register(self.close_all)
+        self._initialized = True
+    
+    def close_all(self):
+        """Close the read-write and read-only connections"""
+        with self._write_lock:
+            if self._rw is not None:
+                self._rw.close()
+                self._rw = None
+        for conn, lock in self._readers:
+            with lock:
+                conn.close()
+        self._readers = []
+        type(self)._instance = None
+    
+    @contextmanager
+    def _transaction(self, begin="BEGIN"):
+        """Run a block of statements on the read-write connection as one transaction"""
+        with self._write_lock:
+            self._rw.execute(begin)
+            try:
+                yield self._rw
+            except Exception:
+                if self._rw.in_transaction:
+                    self._rw.execute("ROLLBACK")
+                raise
+            self._rw.execute("COMMIT")
+    
+    def _read_sql(self, query, params=None):
+        """Run a SELECT on the next read-only connection and return a DataFrame"""
+        conn, lock = next(self._reader_cycle)
+        with lock:
+            return pd.read_sql_query(query, conn, params=params)
+    
+    def _read_rows(self, query, params=()):
+        """Run a SELECT on the next read-only connection and return a list of dicts"""
+        conn, lock = next(self._reader_cycle)
+        with lock:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            return [dict(row) for row in cursor.execute(query, params)]
     
     def init_databases(self):
-        os.makedirs(Config.DATABASE_PATH, exist_ok=True)
         self.create_props_tables()
         print("✅ Database initialized")
     
     def create_props_tables(self):
-        conn = sqlite3.connect(self.props_db)
-        cursor = conn.cursor()
+        cursor = self._rw.cursor()
         
         # Check if odds column exists, if not add it
         cursor.execute("PRAGMA table_info(props)")
         columns = [column[1] for column in cursor.fetchall()]
         
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS props (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                sport TEXT NOT NULL,
-                player_name TEXT NOT NULL,
-                prop_type TEXT NOT NULL,
-                line_value REAL NOT NULL,
-                bet_type TEXT,
-                odds TEXT,
-                raw_input TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                analyzed BOOLEAN DEFAULT FALSE,
-                recommended BOOLEAN DEFAULT FALSE,
-                confidence_score REAL
-            )
-        """)
+        cursor.executescript(SCHEMA_SQL)
         
         # Add missing columns if they don't exist
         if 'odds' not in columns:
@@ -60,18 +181,60 @@ class DatabaseManager:
                 print("✅ Added raw_input column to database")
             except:
                 pass
-        
-        conn.commit()
-        conn.close()
     
     def add_prop(self, prop_data):
-        conn = sqlite3.connect(self.props_db)
-        cursor = conn.cursor()
+        with self._write_lock:
+            cursor = self._rw.execute(self._insert_sql, self._prop_row(prop_data))
+            return cursor.lastrowid
+    
+    def add_props_bulk(self, props):
+        """Insert many props with one executemany inside a single transaction
+        
+        Returns the new row ids, in the same order as props.
+        """
+        props = list(props)
+        if not props:
+            return []
         
-        cursor.execute("""
-            INSERT INTO props (sport, player_name, prop_type, line_value, bet_type, odds, raw_input)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
+        # IMMEDIATE keeps other writers out, so the AUTOINCREMENT ids are consecutive
+        with self._transaction("BEGIN IMMEDIATE") as conn:
+            conn.executemany(self._insert_sql, (self._prop_row(prop) for prop in props))
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        
+        return list(range(last_id - len(props) + 1, last_id + 1))
+    
+    @contextmanager
+    def import_mode(self):
+        """Drop the secondary indexes for a bulk load and rebuild them once at the end"""
+        with self._write_lock:
+            for name in PROP_INDEX_COLUMNS:
+                self._rw.execute(f"DROP INDEX IF EXISTS {name}")
+            try:
+                yield self
+            finally:
+                for index_sql in PROP_INDEXES:
+                    self._rw.execute(index_sql)
+                self._rw.execute("ANALYZE")
+    
+    def import_props(self, props, chunk_size=IMPORT_CHUNK_SIZE):
+        """Stream a large iterable of props into the database in one write transaction"""
+        rows = map(self._prop_row, props)
+        count = 0
+        
+        with self._transaction("BEGIN IMMEDIATE") as conn:
+            while True:
+                chunk = list(itertools.islice(rows, chunk_size))
+                if not chunk:
+                    break
+                conn.executemany(self._insert_sql, chunk)
+                count += len(chunk)
+        
+        return count
+    
+    @staticmethod
+    def _prop_row(prop_data):
+        """Build the INSERT_PROP_SQL parameter tuple for a prop dict"""
+        return (
             prop_data['sport'],
             prop_data['player_name'],
             prop_data['prop_type'],
@@ -79,74 +242,77 @@ class DatabaseManager:
             prop_data.get('bet_type'),
             prop_data.get('odds'),
             prop_data.get('raw_input')
-        ))
-        
-        prop_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        return prop_id
+        )
     
-    def get_recommended_props(self):
-        conn = sqlite3.connect(self.props_db)
+    def get_recommended_props(self, limit=-1):
+        """Recommended props as dicts, highest confidence first; limit=-1 returns them all"""
         try:
-            df = pd.read_sql_query("""
-                SELECT * FROM props
+            return self._read_rows("""
+                SELECT id, sport, player_name, prop_type, line_value, bet_type, confidence_score
+                FROM props
                 WHERE recommended = TRUE
                 ORDER BY confidence_score DESC
-            """, conn)
+                LIMIT ?
+            """, (limit,))
         except Exception as e:
             print(f"⚠️ Database query error: {e}")
-            df = pd.DataFrame()
-        conn.close()
-        return df
+            return []
+    
+    def count_recommended_props(self):
+        try:
+            return self._read_rows("SELECT COUNT(*) AS n FROM props WHERE recommended = TRUE")[0]['n']
+        except Exception as e:
+            print(f"⚠️ Database query error: {e}")
+            return 0
     
     def update_prop_analysis(self, prop_id, analysis_data):
         """Update prop with analysis results"""
-        conn = sqlite3.connect(self.props_db)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            UPDATE props
-            SET analyzed = TRUE,
-                recommended = ?,
-                confidence_score = ?
-            WHERE id = ?
-        """, (
-            analysis_data.get('recommended', False),
-            analysis_data.get('confidence_score', 0),
-            prop_id
-        ))
-        
-        conn.commit()
-        conn.close()
+        with self._write_lock:
+            self._rw.execute(UPDATE_ANALYSIS_SQL, (
+                analysis_data.get('recommended', False),
+                analysis_data.get('confidence_score', 0),
+                prop_id
+            ))
         print("✅ Updated database with analysis results")
     
+    def update_prop_analyses_bulk(self, results):
+        """Update many props with analysis results in a single transaction
+        
+        results: iterable of (prop_id, recommended, confidence_score) tuples
+        """
+        rows = [(recommended, confidence_score, prop_id)
+                for prop_id, recommended, confidence_score in results]
+        if not rows:
+            return 0
+        
+        with self._transaction("BEGIN IMMEDIATE") as conn:
+            conn.executemany(UPDATE_ANALYSIS_SQL, rows)
+        
+        print(f"✅ Updated database with {len(rows)} analysis results")
+        return len(rows)
+    
     def get_unanalyzed_props(self):
         """Get props that haven't been analyzed yet"""
-        conn = sqlite3.connect(self.props_db)
         try:
-            df = pd.read_sql_query("""
+            df = self._read_sql("""
                 SELECT * FROM props
                 WHERE analyzed = FALSE
                 ORDER BY created_at DESC
-            """, conn)
+            """)
         except:
             df = pd.DataFrame()
-        conn.close()
         return df
     
     def get_all_props(self):
         """Get all props for reporting"""
-        conn = sqlite3.connect(self.props_db)
         try:
-            df = pd.read_sql_query("""
+            df = self._read_sql("""
                 SELECT * FROM props
                 ORDER BY created_at DESC
-            """, conn)
+            """)
         except Exception as e:
             print(f"⚠️ Database query error: {e}")
             df = pd.DataFrame()
-        conn.close()
         return df
 '''
 
@@ -156,8 +322,9 @@ class DatabaseManager:
 
 quick_fix_script = '''
 import os
-import sqlite3
+from contextlib import closing
 from config import Config
+from database_manager import SCHEMA_SQL, connect_props_db
 
 def fix_database():
     """Delete old database and recreate with proper schema"""
@@ -167,33 +334,18 @@ def fix_database():
         os.remove(Config.PROPS_DB)
         print("🗑️ Deleted old props database")
     
+    # Stale WAL sidecars would otherwise be replayed into the new database
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists(Config.PROPS_DB + suffix):
+            os.remove(Config.PROPS_DB + suffix)
+    
     if os.path.exists(Config.STATS_DB):
         os.remove(Config.STATS_DB)
         print("🗑️ Deleted old stats database")
     
     # Create new database with proper schema
-    conn = sqlite3.connect(Config.PROPS_DB)
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        CREATE TABLE props (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            sport TEXT NOT NULL,
-            player_name TEXT NOT NULL,
-            prop_type TEXT NOT NULL,
-            line_value REAL NOT NULL,
-            bet_type TEXT,
-            odds TEXT,
-            raw_input TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            analyzed BOOLEAN DEFAULT FALSE,
-            recommended BOOLEAN DEFAULT FALSE,
-            confidence_score REAL
-        )
-    """)
-    
-    conn.commit()
-    conn.close()
+    with closing(connect_props_db(Config.PROPS_DB)) as conn:
+        conn.executescript(SCHEMA_SQL)
     print("✅ Created new database with proper schema")
 
 if __name__ == "__main__":
@@ -12,29 +12,45 @@ print(f"Current directory: {current_dir}")
 wb_folder = os.path.join(current_dir, "WagerBrain")
 wb_nested = os.path.join(current_dir, "WagerBrain", "WagerBrain")
 
+# One directory scan per level; DirEntry caches the file type from readdir
+def scan_dir(path):
+    with os.scandir(path) as it:
+        return {entry.name: entry for entry in it}
+
+top_entries = scan_dir(current_dir)
+wb_entry = top_entries.get("WagerBrain")
+wb_entries = scan_dir(wb_folder) if wb_entry and wb_entry.is_dir() else None
+nested_entry = wb_entries.get("WagerBrain") if wb_entries else None
+nested_entries = scan_dir(wb_nested) if nested_entry and nested_entry.is_dir() else None
+
 print(f"\nFolder checks:")
-print(f"WagerBrain folder exists: {os.path.exists(wb_folder)}")
-print(f"WagerBrain/WagerBrain folder exists: {os.path.exists(wb_nested)}")
+print(f"WagerBrain folder exists: {wb_entries is not None}")
+print(f"WagerBrain/WagerBrain folder exists: {nested_entries is not None}")
 
-if os.path.exists(wb_folder):
+if wb_entries is not None:
     print(f"\nContents of WagerBrain/:")
-    for item in os.listdir(wb_folder):
+    for item in wb_entries:
         print(f"  - {item}")
 
-if os.path.exists(wb_nested):
+if nested_entries is not None:
     print(f"\nContents of WagerBrain/WagerBrain/:")
-    for item in os.listdir(wb_nested):
+    for item in nested_entries:
         print(f"  - {item}")
     
     # Check __init__.py specifically
     init_file = os.path.join(wb_nested, "__init__.py")
+    init_entry = nested_entries.get("__init__.py")
     print(f"\n__init__.py check:")
-    print(f"  Exists: {os.path.exists(init_file)}")
-    if os.path.exists(init_file):
-        with open(init_file, 'r') as f:
-            content = f.read()
-        print(f"  Size: {len(content)} characters")
-        print(f"  First 200 chars: {content[:200]}")
+    print(f"  Exists: {init_entry is not None}")
+    if init_entry is not None:
+        # Only peek at the head of the file; the size comes from stat, not a full read
+        fd = os.open(init_file, os.O_RDONLY)
+        try:
+            head = os.read(fd, 4096).decode('utf-8', 'ignore')
+        finally:
+            os.close(fd)
+        print(f"  Size: {init_entry.stat().st_size} bytes")
+        print(f"  First 200 chars: {head[:200]}")
 
 # Check Python path
 print(f"\nPython path (first 5 entries):")
@@ -90,14 +106,13 @@ except Exception as e:
 # Method 4: Check what pip thinks is installed
 print(f"\nChecking pip installations:")
 try:
-    import pkg_resources
-    installed = list(pkg_resources.working_set)
-    wagerbrain_packages = [pkg for pkg in installed if 'wager' in pkg.project_name.lower()]
-    print(f"Packages with 'wager': {[pkg.project_name for pkg in wagerbrain_packages]}")
+    from importlib.metadata import distributions
+    wagerbrain_packages = [d for d in distributions() if 'wager' in (d.metadata['Name'] or '').lower()]
+    print(f"Packages with 'wager': {[pkg.metadata['Name'] for pkg in wagerbrain_packages]}")
     
     if wagerbrain_packages:
         for pkg in wagerbrain_packages:
-            print(f"  {pkg.project_name} {pkg.version} at {pkg.location}")
+            print(f"  {pkg.metadata['Name']} {pkg.version} at {pkg.locate_file('')}")
 except Exception as e:
     print(f"Error checking pip packages: {e}")
 
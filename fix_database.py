@@ -1,6 +1,7 @@
 import os
-import sqlite3
+from contextlib import closing
 from config import Config
+from database_manager import SCHEMA_SQL, connect_props_db
 
 def fix_database():
     """Delete old database and recreate with proper schema"""
@@ -10,29 +11,15 @@ def fix_database():
         os.remove(Config.PROPS_DB)
         print("🗑️ Deleted old props database")
     
-    # Create new database with proper schema
-    conn = sqlite3.connect(Config.PROPS_DB)
-    cursor = conn.cursor()
+    # Stale WAL sidecars would otherwise be replayed into the new database
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists(Config.PROPS_DB + suffix):
+            os.remove(Config.PROPS_DB + suffix)
     
-    cursor.execute("""
-        CREATE TABLE props (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            sport TEXT NOT NULL,
-            player_name TEXT NOT NULL,
-            prop_type TEXT NOT NULL,
-            line_value REAL NOT NULL,
-            bet_type TEXT,
-            odds TEXT,
-            raw_input TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            analyzed BOOLEAN DEFAULT FALSE,
-            recommended BOOLEAN DEFAULT FALSE,
-            confidence_score REAL
-        )
-    """)
+    # Create new database with the same schema and PRAGMAs as DatabaseManager
+    with closing(connect_props_db(Config.PROPS_DB)) as conn:
+        conn.executescript(SCHEMA_SQL)
     
-    conn.commit()
-    conn.close()
     print("✅ Created new database with proper schema")
 
 if __name__ == "__main__":
@@ -0,0 +1,8 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+# One process-wide connection pool shared by the API fetchers and the scraper,
+# so every subsystem reuses the same keep-alive TLS connections.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=3))
+SESSION.headers.update({"User-Agent": "PropBot/2.0"})
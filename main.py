@@ -1,8 +1,10 @@
 import sys
 import argparse
+import json
+import logging
 import os
 from datetime import datetime
-import requests
+import numpy as np
 
 print("🚀 Starting Multi-Sport Prop Analysis System...")
 print(f"Python version: {sys.version}")
@@ -54,9 +56,35 @@ except Exception as e:
 
 print("\n🏗️ All imports successful! Creating system...")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+log = logging.getLogger(__name__)
+
+try:
+    from http_session import SESSION
+    from ttl_cache import TTLCache
+except Exception as e:
+    print(f"  ❌ Helper module import failed: {e}")
+    sys.exit(1)
+
+# Number of buffered props that triggers a bulk database insert
+PROP_BATCH_SIZE = 1000
+
+# Seconds a fetched player's stats stay reusable in one session
+STATS_CACHE_TTL = 300
+
 class PropAnalysisSystem:
     def __init__(self):
         print("🔧 Initializing PropAnalysisSystem...")
+        self._pending_props = []
+        self._stats_cache = TTLCache(maxsize=1024, ttl=STATS_CACHE_TTL)
+        
+        # Process-wide keep-alive pool, also used by the PrizePicks scraper
+        self.session = SESSION
         
         try:
             print("  Creating DatabaseManager...")
@@ -76,7 +104,7 @@ class PropAnalysisSystem:
             
         try:
             print("  Creating RapidAPIDataFetcher...")
-            self.fetcher = RapidAPIDataFetcher()
+            self.fetcher = RapidAPIDataFetcher(session=self.session)
             print("  ✅ RapidAPIDataFetcher created")
         except Exception as e:
             print(f"  ❌ RapidAPIDataFetcher creation failed: {e}")
@@ -99,16 +127,16 @@ class PropAnalysisSystem:
         try:
             # Test prop parsing
             test_prop = "Mike Trout Over 1.5 Hits +120"
-            print(f"  Testing prop: {test_prop}")
+            log.debug("  Testing prop: %s", test_prop)
             props = self.parser.parse_manual_input(test_prop)
             
             if props:
                 prop = props[0]
-                print(f"  ✅ Parsed: {prop['player_name']} {prop['prop_type']} {prop['line_value']}")
+                log.debug("  ✅ Parsed: %s %s %s", prop['player_name'], prop['prop_type'], prop['line_value'])
                 
                 # Test database
                 prop_id = self.db.add_prop(prop)
-                print(f"  ✅ Added to database with ID: {prop_id}")
+                log.debug("  ✅ Added to database with ID: %s", prop_id)
                 
                 # Test analysis (basic)
                 player_stats = {
@@ -118,14 +146,14 @@ class PropAnalysisSystem:
                 }
                 
                 analysis = self.analyzer.analyze_prop(prop, player_stats)
-                print(f"  ✅ Analysis complete: {analysis['recommendation']}")
-                print(f"  🔎 Analysis details: {analysis}")
+                log.info("  ✅ Analysis complete: %s", analysis['recommendation'])
+                log.debug("  🔎 Analysis details: %s", analysis)
                 
             else:
-                print("  ❌ Prop parsing failed")
+                log.info("  ❌ Prop parsing failed")
                 
         except Exception as e:
-            print(f"  ❌ Basic functionality test failed: {e}")
+            log.info("  ❌ Basic functionality test failed: %s", e)
             raise
     
     def interactive_mode(self):
@@ -134,7 +162,7 @@ class PropAnalysisSystem:
         print("=" * 60)
         print("Enter props to analyze (or commands):")
         print("💡 Example: 'Mike Trout Over 1.5 Hits +120'")
-        print("📋 Commands: 'test', 'help', 'quit'")
+        print("📋 Commands: 'test', 'flush', 'help', 'quit'")
         print("-" * 60)
         
         while True:
@@ -142,6 +170,7 @@ class PropAnalysisSystem:
                 prop_text = input("\n📝 Enter prop or command: ").strip()
                 
                 if prop_text.lower() in ['quit', 'exit', 'q']:
+                    self.flush_props()
                     print("👋 Goodbye!")
                     break
                 
@@ -149,65 +178,104 @@ class PropAnalysisSystem:
                     self.test_basic_functionality()
                     continue
                 
+                if prop_text.lower() == 'flush':
+                    self.flush_props()
+                    continue
+                
                 if prop_text.lower() == 'help':
                     print("\n📚 Available commands:")
                     print("  test - Run basic functionality test")
+                    print("  flush - Save buffered props to the database")
                     print("  help - Show this help")
                     print("  quit - Exit")
                     print("  Or enter a prop like: 'Mike Trout Over 1.5 Hits +120'")
                     continue
                 
                 if prop_text:
-                    print(f"🔍 Analyzing: {prop_text}")
+                    log.debug("🔍 Analyzing: %s", prop_text)
                     props = self.parser.parse_manual_input(prop_text)
                     if props:
                         prop = props[0]
-                        print(f"✅ Parsed successfully: {prop}")
+                        log.debug("✅ Parsed successfully: %s", prop)
                         # Ask for PrizePicks payout multiplier
                         try:
                             payout_input = input("Enter PrizePicks payout multiplier (e.g., 3 for 2-pick Power Play): ").strip()
                             payout_multiplier = float(payout_input)
                             implied_prob, american_odds = self.payout_to_implied_odds(payout_multiplier)
-                            print(f"💰 PrizePicks Implied Probability: {implied_prob:.2%} | Implied Odds: {american_odds:+}")
+                            log.info("💰 PrizePicks Implied Probability: %.2f%% | Implied Odds: %+d",
+                                     implied_prob * 100, american_odds)
                         except Exception as e:
-                            print(f"⚠️ Could not calculate implied odds: {e}")
+                            log.info("⚠️ Could not calculate implied odds: %s", e)
                             payout_multiplier = None
-                        # Add to database
-                        try:
-                            prop_id = self.db.add_prop(prop)
-                            print(f"  ✅ Added to database with ID: {prop_id}")
-                        except Exception as db_e:
-                            print(f"  ⚠️ Database add failed: {db_e}")
+                        # Buffer for the next bulk database insert
+                        self._pending_props.append(prop)
+                        log.debug("  📥 Buffered for database (%d pending)", len(self._pending_props))
+                        if len(self._pending_props) >= PROP_BATCH_SIZE:
+                            self.flush_props()
                         # Fetch player stats from API
                         try:
-                            player_stats = self.fetcher.fetch_player_stats(
-                                prop['player_name'],
-                                prop['sport']
-                            )
-                            print(f"🌐 API player stats: {player_stats}")  # Show API response
+                            player_stats = self.get_player_stats(prop['player_name'], prop['sport'])
+                            log.debug("🌐 API player stats: %s", player_stats)
                             if not player_stats:
-                                print("❌ No player stats returned from API. Cannot analyze.")
+                                log.info("❌ No player stats returned from API. Cannot analyze.")
                                 continue
                         except Exception as fetch_e:
-                            print(f"❌ API fetch failed: {fetch_e}")
+                            log.info("❌ API fetch failed: %s", fetch_e)
                             continue
                         # Analyze
                         try:
                             analysis = self.analyzer.analyze_prop(prop, player_stats)
-                            print(f"  ✅ Analysis complete: {analysis['recommendation']}")
-                            print(f"  🔎 Analysis details: {analysis}")
+                            log.info("  ✅ Analysis complete: %s", analysis['recommendation'])
+                            log.debug("  🔎 Analysis details: %s", analysis)
                         except Exception as ana_e:
-                            print(f"  ❌ Analysis failed: {ana_e}")
+                            log.info("  ❌ Analysis failed: %s", ana_e)
                     else:
-                        print("❌ Could not parse prop")
+                        log.info("❌ Could not parse prop")
                 
             except KeyboardInterrupt:
+                self.flush_props()
                 print("\n👋 Goodbye!")
                 break
             except Exception as e:
-                print(f"❌ Error: {e}")
+                log.info("❌ Error: %s", e)
+
+    def import_json(self, path):
+        """Bulk-load a props archive written by PrizePicksScraper.save_props_to_file"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        props = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+        
+        with self.db.import_mode():
+            count = self.db.import_props(props)
+        log.info("  ✅ Imported %d prop(s) from %s", count, path)
+        return count
+
+    def get_player_stats(self, player_name, sport):
+        """Fetch player stats, reusing a recent result for the same player"""
+        key = (player_name, sport)
+        player_stats = self._stats_cache.get(key)
+        if player_stats is None:
+            player_stats = self.fetcher.fetch_player_stats(player_name, sport)
+            if player_stats:
+                self._stats_cache[key] = player_stats
+        else:
+            log.debug("  ♻️ Using cached stats for %s", player_name)
+        return player_stats
+
+    def flush_props(self):
+        """Write buffered props to the database in one transaction"""
+        if not self._pending_props:
+            return
+        try:
+            prop_ids = self.db.add_props_bulk(self._pending_props)
+            log.info("  ✅ Added %d prop(s) to database", len(prop_ids))
+            self._pending_props = []
+        except Exception as db_e:
+            log.info("  ⚠️ Database add failed: %s", db_e)
 
     def payout_to_implied_odds(self, payout_multiplier):
+        if np.ndim(payout_multiplier):
+            return self.payout_to_implied_odds_batch(payout_multiplier)
         implied_prob = 1 / payout_multiplier
         if implied_prob > 0.5:
             american_odds = -100 * (implied_prob / (1 - implied_prob))
@@ -215,6 +283,15 @@ class PropAnalysisSystem:
             american_odds = 100 * ((1 - implied_prob) / implied_prob)
         return implied_prob, round(american_odds)
 
+    def payout_to_implied_odds_batch(self, multipliers):
+        """Vectorized payout_to_implied_odds; returns (probs, rounded American odds) arrays"""
+        implied = 1 / np.asarray(multipliers, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            odds = np.where(implied > 0.5,
+                            -100 * implied / (1 - implied),
+                            100 * (1 - implied) / implied)
+        return implied, np.rint(odds)
+
 def main():
     """Main entry point with debug output"""
     print("\n🎯 Main function starting...")
@@ -224,10 +301,13 @@ def main():
     parser.add_argument('--mode', choices=['interactive', 'test'], 
                        default='interactive', help='Run mode')
     parser.add_argument('--prop', help='Analyze a single prop')
+    parser.add_argument('--import-json', metavar='PATH', help='Bulk-load a saved props JSON file')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
+    parser.add_argument('--verbose', action='store_true', help='Show per-prop parse/API/analysis details')
     
     try:
         args = parser.parse_args()
+        logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format='%(message)s')
         print(f"  Arguments parsed: mode={args.mode}")
     except Exception as e:
         print(f"❌ Argument parsing failed: {e}")
@@ -247,6 +327,10 @@ def main():
     
     # Handle different modes
     try:
+        if args.import_json:
+            system.import_json(args.import_json)
+            return
+        
         if args.prop:
             print(f"  Analyzing single prop: {args.prop}")
             props = system.parser.parse_manual_input(args.prop)
@@ -1,20 +1,77 @@
-import requests
 import json
-import time
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
 import undetected_chromedriver as uc
 from datetime import datetime
 import pandas as pd
+from http_session import SESSION
+from data_fetcher import decode_json
+
+# lxml builds the tree in C; fall back to the pure-Python parser without it
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# orjson serializes in native code; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Only materialize the pick containers instead of the whole board DOM
+PICK_STRAINER = SoupStrainer('div', class_='pick')
 
 class PrizePicksScraper:
-    def __init__(self, headless=True):
-        self.setup_driver(headless)
+    API_URL = "https://api.prizepicks.com/projections"
+    
+    # PrizePicks league ids for the projections endpoint
+    LEAGUE_IDS = {
+        'MLB': 2,
+        'NBA': 7,
+        'NHL': 8,
+        'NFL': 9
+    }
+    
+    # Stat vocabulary per sport, checked in priority order by detect_sport
+    SPORT_TOKENS = {
+        'MLB': frozenset({'hits', 'runs', 'rbis', 'strikeouts'}),
+        'NFL': frozenset({'yards', 'touchdowns', 'completions'}),
+        'NBA': frozenset({'points', 'rebounds', 'assists'}),
+        'NHL': frozenset({'goals', 'saves', 'assists'})
+    }
+    
+    STAT_TOKEN_PATTERN = re.compile(r'[a-z]+')
+    
+    # Pick container selectors, compiled once instead of per container
+    SEL_PLAYER = sv.compile('div.player-name')
+    SEL_STAT = sv.compile('div.stat-type')
+    SEL_LINE = sv.compile('div.line')
+    
+    def __init__(self, headless=True, use_browser=False):
         self.base_url = "https://app.prizepicks.com"
+        self.headless = headless
+        self.use_browser = use_browser
+        self.driver = None
+        
+        # Shared process-wide pool; PrizePicks-specific headers go on each request
+        self.session = SESSION
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 '
+                          '(KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1',
+            'Accept': 'application/json'
+        }
         
     def setup_driver(self, headless=True):
         """Setup undetected Chrome driver"""
@@ -31,21 +88,98 @@ class PrizePicksScraper:
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
     def scrape_sport_props(self, sport="NBA"):
-        """Scrape props for specific sport"""
+        """Fetch props for specific sport from the PrizePicks projections API"""
+        print(f"🔍 Fetching {sport} props from PrizePicks API...")
+        
+        league_id = self.LEAGUE_IDS.get(sport.upper())
+        if league_id is None:
+            print(f"❌ Unknown PrizePicks league: {sport}")
+            return []
+        
+        try:
+            response = self.session.get(
+                self.API_URL,
+                params={'league_id': league_id, 'per_page': 500},
+                headers=self.headers,
+                timeout=15
+            )
+            response.raise_for_status()
+            props = self.parse_projections(decode_json(response), sport)
+            
+            print(f"✅ Fetched {len(props)} {sport} props")
+            return props
+            
+        except Exception as e:
+            print(f"❌ PrizePicks API error: {e}")
+            if self.use_browser:
+                return self.scrape_sport_props_browser(sport)
+            return []
+    
+    def parse_projections(self, payload, sport=None):
+        """Join projections with their players from a projections API payload"""
+        # Index the side-loaded players and leagues once instead of scanning per projection
+        included = {
+            (item.get('type'), item.get('id')): item.get('attributes', {})
+            for item in payload.get('included', [])
+        }
+        league_by_id = {str(league_id): name for name, league_id in self.LEAGUE_IDS.items()}
+        scraped_at = datetime.now().isoformat()
+        
+        props = []
+        for projection in payload.get('data', []):
+            attributes = projection.get('attributes', {})
+            relationships = projection.get('relationships', {})
+            player_ref = (relationships.get('new_player') or {}).get('data') or {}
+            league_ref = (relationships.get('league') or {}).get('data') or {}
+            
+            player = included.get(('new_player', player_ref.get('id')), {})
+            stat_type = attributes.get('stat_type')
+            line_score = attributes.get('line_score')
+            if not player.get('name') or not stat_type or line_score is None:
+                continue
+            
+            league_id = str(league_ref.get('id', ''))
+            league = included.get(('league', league_id), {}).get('name') or league_by_id.get(league_id)
+            
+            props.append({
+                'player_name': player['name'],
+                'prop_type': stat_type.lower().replace(' ', '_'),
+                'line_value': float(line_score),
+                'bet_type': 'over',
+                'odds': '+100',
+                'sportsbook': 'PrizePicks',
+                'scraped_at': scraped_at,
+                'sport': league or sport or self.detect_sport(stat_type)
+            })
+        
+        return props
+    
+    def scrape_sport_props_browser(self, sport="NBA"):
+        """Scrape props for specific sport by rendering the board in Chrome"""
         print(f"🔍 Scraping {sport} props from PrizePicks...")
         
         try:
-            # Navigate to PrizePicks
-            self.driver.get(f"{self.base_url}/board")
-            time.sleep(3)
+            if self.driver is None:
+                self.setup_driver(self.headless)
+            
+            # Navigate to PrizePicks once; later sports just switch tabs on the loaded board
+            if '/board' not in (self.driver.current_url or ''):
+                self.driver.get(f"{self.base_url}/board")
             
             # Wait for sport selection
             sport_selector = f"//button[contains(text(), '{sport}')]"
             sport_button = WebDriverWait(self.driver, 10).until(
                 EC.element_to_be_clickable((By.XPATH, sport_selector))
             )
+            old_picks = self.driver.find_elements(By.CLASS_NAME, "pick")
             sport_button.click()
-            time.sleep(2)
+            
+            # Wait for the previous sport's picks to be swapped out
+            if old_picks:
+                try:
+                    WebDriverWait(self.driver, 10).until(EC.staleness_of(old_picks[0]))
+                except TimeoutException:
+                    pass
             
             # Scrape props
             props = self.extract_props()
@@ -67,11 +201,11 @@ class PrizePicksScraper:
                 EC.presence_of_element_located((By.CLASS_NAME, "pick"))
             )
             
-            # Get page source and parse with BeautifulSoup
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            # Parse only the pick containers; every top-level node is one container
+            soup = BeautifulSoup(self.driver.page_source, HTML_PARSER, parse_only=PICK_STRAINER)
             
             # Find prop containers (adjust selectors based on actual PrizePicks structure)
-            prop_containers = soup.find_all('div', class_='pick')
+            prop_containers = soup.find_all('div', class_='pick', recursive=False)
             
             for container in prop_containers:
                 try:
@@ -91,21 +225,21 @@ class PrizePicksScraper:
         """Parse individual prop container"""
         try:
             # Extract player name (adjust selectors as needed)
-            player_elem = container.find('div', class_='player-name')
+            player_elem = self.SEL_PLAYER.select_one(container)
             if not player_elem:
                 return None
             
-            player_name = player_elem.text.strip()
+            player_name = player_elem.get_text(strip=True)
             
             # Extract stat type and line
-            stat_elem = container.find('div', class_='stat-type')
-            line_elem = container.find('div', class_='line')
+            stat_elem = self.SEL_STAT.select_one(container)
+            line_elem = self.SEL_LINE.select_one(container)
             
             if not stat_elem or not line_elem:
                 return None
             
-            stat_type = stat_elem.text.strip()
-            line_value = float(line_elem.text.strip())
+            stat_type = stat_elem.get_text(strip=True)
+            line_value = float(line_elem.get_text(strip=True))
             
             # Extract over/under and odds
             over_under = "over"  # PrizePicks typically shows "More than" = over
@@ -130,28 +264,25 @@ class PrizePicksScraper:
     
     def detect_sport(self, stat_type):
         """Detect sport from stat type"""
-        stat_lower = stat_type.lower()
-        
-        if any(word in stat_lower for word in ['hits', 'runs', 'rbis', 'strikeouts']):
-            return 'MLB'
-        elif any(word in stat_lower for word in ['yards', 'touchdowns', 'completions']):
-            return 'NFL'
-        elif any(word in stat_lower for word in ['points', 'rebounds', 'assists']):
-            return 'NBA'
-        elif any(word in stat_lower for word in ['goals', 'saves', 'assists']):
-            return 'NHL'
-        else:
-            return 'UNKNOWN'
+        # Word tokens so combo stats like "Hits+Runs+RBIs" split cleanly
+        tokens = set(self.STAT_TOKEN_PATTERN.findall(stat_type.lower()))
+        
+        for sport, vocab in self.SPORT_TOKENS.items():
+            if tokens & vocab:
+                return sport
+        return 'UNKNOWN'
     
     def scrape_all_sports(self):
         """Scrape props for all available sports"""
         sports = ['NBA', 'NFL', 'MLB', 'NHL']
         all_props = []
         
-        for sport in sports:
-            props = self.scrape_sport_props(sport)
-            all_props.extend(props)
-            time.sleep(2)  # Rate limiting
+        # One API request per league in flight at once; the browser fallback
+        # shares a single driver, so it has to stay sequential
+        workers = 1 if self.use_browser else len(sports)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for props in pool.map(self.scrape_sport_props, sports):
+                all_props.extend(props)
         
         return all_props
     
@@ -161,20 +292,36 @@ class PrizePicksScraper:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"prizepicks_props_{timestamp}.json"
         
-        with open(filename, 'w') as f:
-            json.dump(props, f, indent=2)
+        if ORJSON_AVAILABLE:
+            # Serialize the whole file up front and hand it to the kernel in one write
+            buf = orjson.dumps(props, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC)
+            if os.name == 'nt':
+                with open(filename, 'wb') as f:
+                    f.write(buf)
+            else:
+                fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    view = memoryview(buf)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+        else:
+            with open(filename, 'w') as f:
+                json.dump(props, f, indent=2)
         
         print(f"💾 Saved {len(props)} props to {filename}")
         return filename
     
     def close(self):
-        """Close the browser"""
-        if hasattr(self, 'driver'):
+        """Close the browser if one was started"""
+        if self.driver is not None:
             self.driver.quit()
+            self.driver = None
 
 # Example usage
 if __name__ == "__main__":
-    scraper = PrizePicksScraper(headless=False)  # Set True for headless
+    scraper = PrizePicksScraper()
     
     try:
         # Scrape NBA props
@@ -1,13 +1,59 @@
-import requests
+import numpy as np
+import bisect
+import dbm
 import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
-from prop_parser import PropParser
+from collections import Counter, defaultdict
+from prop_parser import DATACLASS_SLOTS, PropParser
 from analysis_engine import WagerBrainAnalysisEngine
-from multi_api_data_fetcher import MultiAPIDataFetcher
+from data_fetcher import MultiAPIDataFetcher
+from ttl_cache import TTLCache
 
-@dataclass
+# orjson encodes the on-disk stats cache in native code; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Player stats are reused for this many seconds
+API_CACHE_TTL = 300
+# How long a connectivity probe result is trusted before re-pinging the APIs
+CONNECTIVITY_CACHE_TTL = 60
+API_CACHE_DIR = ".cache"
+# Upper bound on concurrent per-sport odds requests
+SPORTSBOOK_WORKERS = 8
+
+log = logging.getLogger(__name__)
+
+def _dump_cache_entry(entry) -> bytes:
+    """Encode a disk cache entry as JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(entry, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(entry, default=str).encode()
+
+def _load_cache_entry(data: bytes):
+    """Decode a disk cache entry written by _dump_cache_entry"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def setup_logging(level=logging.INFO):
+    """Send workflow output to stdout as plain messages at the given level"""
+    if not log.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        log.addHandler(handler)
+        log.propagate = False
+    log.setLevel(level)
+
+@dataclass(**DATACLASS_SLOTS)
 class PrizePicksEntry:
     """Single PrizePicks entry"""
     player_name: str
@@ -22,7 +68,7 @@ class PrizePicksEntry:
     data_source: str = "unknown"
     api_source: str = "unknown"
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PrizePicksSlip:
     """Complete PrizePicks slip with multiplier"""
     entries: List[PrizePicksEntry]
@@ -39,9 +85,12 @@ class PrizePicksSlip:
 class EnhancedPrizePicksWorkflow:
     """Enhanced PrizePicks analysis workflow with multi-API support"""
     
-    def __init__(self, use_real_apis: bool = True):
+    def __init__(self, use_real_apis: bool = True, verbose: bool = True):
+        self.verbose = verbose
+        self._log_buf: List[str] = []
         self.parser = PropParser()
         self.engine = WagerBrainAnalysisEngine()
+        # The fetcher routes every call through the pooled keep-alive http_session.SESSION
         self.data_fetcher = MultiAPIDataFetcher() if use_real_apis else None
         self.use_real_apis = use_real_apis
         
@@ -54,6 +103,13 @@ class EnhancedPrizePicksWorkflow:
             'sports_covered': set()
         }
         
+        # In-memory TTL caches, with player stats also kept on disk across restarts
+        self._stats_cache = TTLCache(maxsize=1024, ttl=API_CACHE_TTL)
+        self._connectivity_cache = TTLCache(maxsize=1, ttl=CONNECTIVITY_CACHE_TTL)
+        self._live_apis: Dict[str, bool] = {}
+        self._stats_db_path = os.path.join(API_CACHE_DIR, "player_stats")
+        self._stats_db_lock = threading.Lock()
+        
         # PrizePicks multiplier table (updated with more accurate data)
         self.multiplier_table = {
             2: {2: 3.0, 3: 5.5, 4: 10.0, 5: 20.0, 6: 50.0},
@@ -62,57 +118,136 @@ class EnhancedPrizePicksWorkflow:
             5: {5: 40.0, 6: 250.0},
             6: {6: 300.0}
         }
+        
+        self._rng = np.random.default_rng()
+        
+        # Same table as a dense [entry_count, target_count] array; NaN marks a missing payout
+        self._mult_table = np.full((7, 10), np.nan)
+        for entry_count, row in self.multiplier_table.items():
+            for target_count, multiplier in row.items():
+                self._mult_table[entry_count, target_count] = multiplier
     
     def analyze_single_pick(self, prop_text: str, fetch_real_data: bool = None) -> Optional[PrizePicksEntry]:
         """Analyze a single PrizePicks entry with enhanced API support"""
         if fetch_real_data is None:
             fetch_real_data = self.use_real_apis
-            
-        print(f"\n🔍 Analyzing: {prop_text}")
         
-        # Parse the prop
+        parsed_prop = self._parse_pick(prop_text)
+        if not parsed_prop:
+            self._flush_log()
+            return None
+        
+        player_stats, meta = self._fetch_for_parsed(parsed_prop, fetch_real_data)
+        self._merge_fetch_stats([meta])
+        entry = self._run_analysis(prop_text, parsed_prop, player_stats, meta)
+        self._flush_log()
+        return entry
+    
+    def _log(self, message: str = "", *args):
+        """Queue a %-style line of output; it is only formatted when INFO is enabled"""
+        if self.verbose and log.isEnabledFor(logging.INFO):
+            self._log_buf.append(message % args if args else message)
+    
+    def _flush_log(self):
+        """Emit all queued output as a single log record"""
+        if self._log_buf:
+            buf, self._log_buf = self._log_buf, []
+            log.info("%s", "\n".join(buf))
+    
+    def _parse_pick(self, prop_text: str) -> Optional[Dict]:
+        """Parse one pick and record its sport"""
         parsed_prop = self.parser.parse_single_prop(prop_text)
+        # parse_single_prop only returns props that already passed validation
         if not parsed_prop:
-            print(f"❌ Could not parse: {prop_text}")
+            self._log("\n🔍 Analyzing: %s", prop_text)
+            self._log("❌ Could not parse: %s", prop_text)
             return None
         
-        # Update stats
         self.api_stats['sports_covered'].add(parsed_prop['sport'])
+        return parsed_prop
+    
+    def _fetch_for_parsed(self, parsed_prop: Dict, fetch_real_data: bool) -> Tuple[Dict, Dict]:
+        """Fetch player data for a parsed pick; safe to run from worker threads.
+        
+        Doesn't touch api_stats; the returned meta is merged by _merge_fetch_stats.
+        """
+        if not (fetch_real_data and self.data_fetcher):
+            # Use mock data for testing
+            return self._create_enhanced_mock_stats(parsed_prop), {'data_source': 'mock', 'api_source': 'mock'}
         
-        # Fetch player data with enhanced API selection
-        data_source = "unknown"
-        api_source = "unknown"
+        # Don't spend a request (and its timeout) on an API the probe found down
+        if not self._live_apis.get(parsed_prop['sport'], True):
+            meta = {'data_source': 'fallback', 'api_source': 'fallback',
+                    'error': f"{parsed_prop['sport']} API unavailable"}
+            return self._create_enhanced_mock_stats(parsed_prop), meta
         
-        if fetch_real_data and self.data_fetcher:
-            self.api_stats['total_requests'] += 1
+        try:
+            player_stats = self._cached_player_stats(parsed_prop)
+            
+            if not (player_stats and player_stats.get('recent_averages')):
+                raise Exception("No valid data returned from API")
             
+            api_source = player_stats.get('api_source', 'unknown')
+            meta = {'data_source': player_stats.get('data_source', 'api'), 'api_source': api_source,
+                    'requested': True, 'success': True}
+            return player_stats, meta
+            
+        except Exception as e:
+            meta = {'data_source': 'fallback', 'api_source': 'fallback', 'error': e,
+                    'requested': True, 'success': False}
+            return self._create_enhanced_mock_stats(parsed_prop), meta
+    
+    def _merge_fetch_stats(self, metas: List[Dict]):
+        """Fold the workers' per-fetch results into api_stats on the calling thread"""
+        requested = [meta for meta in metas if meta.get('requested')]
+        successes = [meta for meta in requested if meta['success']]
+        self.api_stats['total_requests'] += len(requested)
+        self.api_stats['successful_requests'] += len(successes)
+        self.api_stats['failed_requests'] += len(requested) - len(successes)
+        self.api_stats['apis_used'].update(meta['api_source'] for meta in successes)
+    
+    def _cached_player_stats(self, parsed_prop: Dict) -> Dict:
+        """fetch_player_stats behind the memory and disk TTL caches"""
+        key = (parsed_prop['player_name'], parsed_prop['sport'], parsed_prop['prop_type'])
+        player_stats = self._stats_cache.get(key)
+        if player_stats is not None:
+            return player_stats
+        
+        # Entries are JSON rather than shelve's pickles: cheaper to encode, and
+        # a corrupt or stale-format entry is just a cache miss
+        db_key = "|".join(str(part) for part in key)
+        with self._stats_db_lock:
             try:
-                player_stats = self.data_fetcher.fetch_player_stats(
-                    parsed_prop['player_name'], 
-                    parsed_prop['sport'],
-                    parsed_prop['prop_type']
-                )
-                
-                if player_stats and player_stats.get('recent_averages'):
-                    self.api_stats['successful_requests'] += 1
-                    data_source = player_stats.get('data_source', 'api')
-                    api_source = player_stats.get('api_source', 'unknown')
-                    self.api_stats['apis_used'].add(api_source)
-                    print(f"✅ Data fetched from {api_source} API")
-                else:
-                    raise Exception("No valid data returned from API")
-                    
-            except Exception as e:
-                print(f"⚠️ API fetch failed: {e}")
-                self.api_stats['failed_requests'] += 1
-                player_stats = self._create_enhanced_mock_stats(parsed_prop)
-                data_source = "fallback"
-                api_source = "fallback"
-        else:
-            # Use mock data for testing
-            player_stats = self._create_enhanced_mock_stats(parsed_prop)
-            data_source = "mock"
-            api_source = "mock"
+                with dbm.open(self._stats_db_path, 'r') as db:
+                    hit = _load_cache_entry(db[db_key])
+            except Exception:
+                hit = None
+        if hit and time.time() - hit['fetched_at'] < API_CACHE_TTL:
+            self._stats_cache[key] = hit['stats']
+            return hit['stats']
+        
+        player_stats = self.data_fetcher.fetch_player_stats(*key)
+        if player_stats and player_stats.get('recent_averages'):
+            self._stats_cache[key] = player_stats
+            with self._stats_db_lock:
+                try:
+                    os.makedirs(API_CACHE_DIR, exist_ok=True)
+                    with dbm.open(self._stats_db_path, 'c') as db:
+                        db[db_key] = _dump_cache_entry({'fetched_at': time.time(), 'stats': player_stats})
+                except Exception as e:
+                    self._log("⚠️ Could not persist stats cache: %s", e)
+        return player_stats
+    
+    def _run_analysis(self, prop_text: str, parsed_prop: Dict, player_stats: Dict,
+                      meta: Dict) -> Optional[PrizePicksEntry]:
+        """Run the engine on fetched data and build the entry"""
+        self._log("\n🔍 Analyzing: %s", prop_text)
+        
+        api_source = meta['api_source']
+        if 'error' in meta:
+            self._log("⚠️ API fetch failed: %s", meta['error'])
+        elif api_source != 'mock':
+            self._log("✅ Data fetched from %s API", api_source)
         
         # Run analysis
         try:
@@ -128,69 +263,62 @@ class EnhancedPrizePicksWorkflow:
                 true_probability=result['wagerbrain_analysis']['true_probability'],
                 expected_value=result['wagerbrain_analysis']['expected_value'],
                 recommendation=result['recommendation'],
-                data_source=data_source,
+                data_source=meta['data_source'],
                 api_source=api_source
             )
             
-            print(f"✅ {entry.player_name}: {entry.recommendation} ({entry.confidence_score:.1%}) [{api_source}]")
+            self._log("✅ %s: %s (%.1f%%) [%s]", entry.player_name, entry.recommendation, entry.confidence_score * 100, api_source)
             return entry
             
         except Exception as e:
-            print(f"❌ Analysis failed for {prop_text}: {e}")
+            self._log("❌ Analysis failed for %s: %s", prop_text, e)
             return None
     
     def analyze_slip(self, prop_texts: List[str], target_multiplier: float = None, 
                     fetch_real_data: bool = None) -> Optional[PrizePicksSlip]:
         """Analyze complete PrizePicks slip with enhanced API tracking"""
-        print(f"\n🎯 ANALYZING PRIZEPICKS SLIP WITH MULTI-API SUPPORT")
-        print(f"{'='*60}")
+        self._log("\n🎯 ANALYZING PRIZEPICKS SLIP WITH MULTI-API SUPPORT")
+        self._log("=" * 60)
         
         if fetch_real_data is None:
             fetch_real_data = self.use_real_apis
         
+        # Parse and validate every leg before any network traffic
+        parsed = self._parse_slip(prop_texts)
+        if not parsed:
+            self._log("❌ No valid entries to analyze")
+            self._flush_log()
+            return None
+        
         # Test API connectivity first if using real APIs
         if fetch_real_data:
-            print("🔗 Testing API connectivity...")
-            connectivity = self.data_fetcher.test_api_connectivity()
-            available_apis = [sport for sport, result in connectivity.items() if result['status'] == 'success']
-            print(f"✅ Available APIs: {len(available_apis)}/{len(connectivity)}")
-        
-        # Analyze each pick
-        entries = []
-        for prop_text in prop_texts:
-            entry = self.analyze_single_pick(prop_text, fetch_real_data)
-            if entry:
-                entries.append(entry)
+            self._probe_connectivity()
         
+        entries = self._fetch_and_analyze(parsed, fetch_real_data)
         if not entries:
-            print("❌ No valid entries to analyze")
+            self._log("❌ No valid entries to analyze")
+            self._flush_log()
             return None
         
         entry_count = len(entries)
-        print(f"\n📊 SLIP SUMMARY: {entry_count} entries")
+        self._log("\n📊 SLIP SUMMARY: %s entries", entry_count)
         
         # Calculate API usage stats
         apis_used = len(self.api_stats['apis_used'])
         success_rate = (self.api_stats['successful_requests'] / max(self.api_stats['total_requests'], 1)) * 100
         
-        print(f"🌐 API Usage: {apis_used} different APIs, {success_rate:.1f}% success rate")
+        self._log("🌐 API Usage: %s different APIs, %.1f%% success rate", apis_used, success_rate)
         
         # Calculate slip probability (all picks must hit)
-        slip_probability = 1.0
-        for entry in entries:
-            if entry.bet_type == 'over':
-                pick_prob = entry.true_probability
-            else:  # under
-                pick_prob = 1 - entry.true_probability
-            slip_probability *= pick_prob
+        slip_probability = float(self._slip_probabilities([entries])[0])
         
         # Get multiplier
         if target_multiplier:
             multiplier = target_multiplier
-            print(f"🎲 Using provided multiplier: {multiplier}x")
+            self._log("🎲 Using provided multiplier: %sx", multiplier)
         else:
             multiplier = self._estimate_multiplier(entry_count, slip_probability)
-            print(f"🎲 Estimated multiplier: {multiplier}x")
+            self._log("🎲 Estimated multiplier: %sx", multiplier)
         
         # Calculate expected value
         stake = 1.0  # $1 stake
@@ -219,41 +347,133 @@ class EnhancedPrizePicksWorkflow:
         )
         
         self._print_enhanced_slip_analysis(slip)
+        self._flush_log()
         return slip
     
+    def analyze_slips_batch(self, slip_prop_texts: List[List[str]], target_multiplier: float = None,
+                            fetch_real_data: bool = None) -> List[Optional[PrizePicksSlip]]:
+        """Analyze many candidate slips, doing the slip math for all of them at once"""
+        if fetch_real_data is None:
+            fetch_real_data = self.use_real_apis
+        
+        parsed_slips = [self._parse_slip(prop_texts) for prop_texts in slip_prop_texts]
+        if fetch_real_data and any(parsed_slips):
+            self._probe_connectivity()
+        
+        entry_lists = [self._fetch_and_analyze(parsed, fetch_real_data) if parsed else []
+                       for parsed in parsed_slips]
+        valid = [i for i, entries in enumerate(entry_lists) if entries]
+        slips: List[Optional[PrizePicksSlip]] = [None] * len(entry_lists)
+        if not valid:
+            self._flush_log()
+            return slips
+        
+        entry_lists_valid = [entry_lists[i] for i in valid]
+        probs = self._slip_probabilities(entry_lists_valid)
+        if target_multiplier:
+            multipliers = np.full(len(valid), float(target_multiplier))
+        else:
+            multipliers = self._estimate_multipliers([len(entries) for entries in entry_lists_valid], probs)
+        payouts = probs * multipliers
+        evs = payouts - 1.0
+        kellys = self._kelly_for_slips(probs, multipliers)
+        
+        apis_used = len(self.api_stats['apis_used'])
+        success_rate = (self.api_stats['successful_requests'] / max(self.api_stats['total_requests'], 1)) * 100
+        
+        for k, i in enumerate(valid):
+            entries = entry_lists[i]
+            slips[i] = PrizePicksSlip(
+                entries=entries,
+                entry_count=len(entries),
+                multiplier=float(multipliers[k]),
+                estimated_payout=float(payouts[k]),
+                slip_probability=float(probs[k]),
+                slip_expected_value=float(evs[k]),
+                kelly_fraction=float(kellys[k]),
+                recommendation=self._generate_slip_recommendation(
+                    entries, float(probs[k]), float(evs[k]), float(kellys[k])
+                ),
+                total_apis_used=apis_used,
+                api_success_rate=success_rate
+            )
+        
+        self._flush_log()
+        return slips
+    
+    def _probe_connectivity(self):
+        """Ping the sport APIs (memoized) and remember which ones are live"""
+        self._log("🔗 Testing API connectivity...")
+        connectivity = self._connectivity_cache.get('all')
+        if connectivity is None:
+            connectivity = self.data_fetcher.test_api_connectivity()
+            self._connectivity_cache['all'] = connectivity
+        self._live_apis = {sport: result['status'] == 'success' for sport, result in connectivity.items()}
+        available_apis = [sport for sport, result in connectivity.items() if result['status'] == 'success']
+        self._log("✅ Available APIs: %s/%s", len(available_apis), len(connectivity))
+    
+    def _parse_slip(self, prop_texts: List[str]) -> List[Tuple[str, Dict]]:
+        """Parse one slip's legs, keeping (prop_text, parsed_prop) for the valid ones"""
+        parsed = [(prop_text, self._parse_pick(prop_text)) for prop_text in prop_texts]
+        return [(prop_text, prop) for prop_text, prop in parsed if prop]
+    
+    def _fetch_and_analyze(self, parsed: List[Tuple[str, Dict]], fetch_real_data: bool) -> List[PrizePicksEntry]:
+        """Fetch player data for parsed legs concurrently, then analyze them in order"""
+        fetched = []
+        if parsed:
+            with ThreadPoolExecutor(max_workers=min(len(parsed), 8)) as executor:
+                fetched = list(executor.map(
+                    lambda item: self._fetch_for_parsed(item[1], fetch_real_data), parsed
+                ))
+            self._merge_fetch_stats([meta for _, meta in fetched])
+        
+        # Analyze in slip order so output stays deterministic
+        entries = []
+        for (prop_text, parsed_prop), (player_stats, meta) in zip(parsed, fetched):
+            entry = self._run_analysis(prop_text, parsed_prop, player_stats, meta)
+            if entry:
+                entries.append(entry)
+        return entries
+    
     def compare_with_sportsbooks(self, entries: List[PrizePicksEntry]) -> Dict:
         """Enhanced sportsbook comparison with API data"""
-        print(f"\n📈 ENHANCED SPORTSBOOK COMPARISON")
-        print(f"{'='*50}")
+        self._log("\n📈 ENHANCED SPORTSBOOK COMPARISON")
+        self._log("=" * 50)
         
         comparisons = []
         
         # If we have real API access, try to get actual sportsbook data
-        if self.use_real_apis and hasattr(self.data_fetcher, 'fetch_sportsbook_odds'):
+        if self.use_real_apis and hasattr(self.data_fetcher, 'fetch_sportsbook_odds_batch'):
+            # One odds request per sport instead of one per entry
+            groups = defaultdict(list)
             for entry in entries:
-                try:
-                    sportsbook_data = self.data_fetcher.fetch_sportsbook_odds(
-                        entry.sport, entry.player_name
-                    )
-                    
-                    if sportsbook_data:
-                        comparison = self._analyze_real_sportsbook_data(entry, sportsbook_data)
-                    else:
-                        comparison = self._create_mock_sportsbook_comparison(entry)
-                        
-                except Exception as e:
-                    print(f"⚠️ Sportsbook data fetch failed for {entry.player_name}: {e}")
-                    comparison = self._create_mock_sportsbook_comparison(entry)
-                
-                comparisons.append(comparison)
-                self._print_sportsbook_comparison(comparison)
+                groups[entry.sport].append(entry.player_name)
+            
+            odds_by_player = {}
+            with ThreadPoolExecutor(max_workers=min(SPORTSBOOK_WORKERS, len(groups)) or 1) as executor:
+                futures = {
+                    sport: executor.submit(self.data_fetcher.fetch_sportsbook_odds_batch, sport, names)
+                    for sport, names in groups.items()
+                }
+                for sport, future in futures.items():
+                    try:
+                        for player_name, data in future.result().items():
+                            odds_by_player[(sport, player_name)] = data
+                    except Exception as e:
+                        self._log("⚠️ Sportsbook data fetch failed for %s: %s", sport, e)
+            
+            # The pool has closed by now, so output below stays in entry order
+            comparisons = [
+                self._compare_one(entry, odds_by_player.get((entry.sport, entry.player_name)))
+                for entry in entries
+            ]
         else:
             # Use mock sportsbook data
-            for entry in entries:
-                comparison = self._create_mock_sportsbook_comparison(entry)
-                comparisons.append(comparison)
-                self._print_sportsbook_comparison(comparison)
+            comparisons = self._create_mock_sportsbook_comparisons(entries)
         
+        for comparison in comparisons:
+            self._print_sportsbook_comparison(comparison)
+        self._flush_log()
         return {
             'comparisons': comparisons,
             'total_entries': len(entries),
@@ -261,6 +481,30 @@ class EnhancedPrizePicksWorkflow:
             'generated_at': datetime.now().isoformat()
         }
     
+    def _compare_one(self, entry: PrizePicksEntry, sportsbook_data: Optional[Dict]) -> Dict:
+        """Compare one entry against its fetched odds, falling back to mock data"""
+        try:
+            if sportsbook_data:
+                return self._analyze_real_sportsbook_data(entry, sportsbook_data)
+        except Exception as e:
+            self._log("⚠️ Sportsbook comparison failed for %s: %s", entry.player_name, e)
+        return self._create_mock_sportsbook_comparison(entry)
+    
+    # Mock season average as a multiple of the line, per prop type
+    _BASE_MULTIPLIERS = {
+        'runs_allowed_1st_inning': 1.2,
+        'hits': 1.15,
+        'runs': 1.1,
+        'home_runs': 0.8,
+        'strikeouts': 1.3,
+        'passing_yards': 1.05,
+        'rushing_yards': 1.1,
+        'receiving_yards': 1.08,
+        'points': 1.12,
+        'rebounds': 1.15,
+        'assists': 1.18
+    }
+    
     def _create_enhanced_mock_stats(self, parsed_prop: Dict) -> Dict:
         """Create enhanced mock stats with more realistic data"""
         prop_type = parsed_prop['prop_type']
@@ -269,21 +513,7 @@ class EnhancedPrizePicksWorkflow:
         player_name = parsed_prop['player_name']
         
         # Enhanced mock data based on prop type and player
-        base_multipliers = {
-            'runs_allowed_1st_inning': 1.2,
-            'hits': 1.15,
-            'runs': 1.1,
-            'home_runs': 0.8,
-            'strikeouts': 1.3,
-            'passing_yards': 1.05,
-            'rushing_yards': 1.1,
-            'receiving_yards': 1.08,
-            'points': 1.12,
-            'rebounds': 1.15,
-            'assists': 1.18
-        }
-        
-        multiplier = base_multipliers.get(prop_type, 1.1)
+        multiplier = self._BASE_MULTIPLIERS.get(prop_type, 1.1)
         mock_avg = line_value * multiplier
         
         # Create sport-specific mock averages
@@ -332,14 +562,15 @@ class EnhancedPrizePicksWorkflow:
         
         # Extract sportsbook lines and odds from real data
         # This would depend on the actual API response format
-        if 'bookmakers' in sportsbook_data:
+        target_key = self._MARKET_KEY_BY_PROP.get(entry.prop_type)
+        if 'bookmakers' in sportsbook_data and target_key:
             for bookmaker in sportsbook_data['bookmakers']:
                 book_name = bookmaker.get('title', 'unknown')
                 markets = bookmaker.get('markets', [])
                 
                 # Find the relevant market for this prop
                 for market in markets:
-                    if self._matches_prop_type(market.get('key'), entry.prop_type):
+                    if market.get('key') == target_key:
                         outcomes = market.get('outcomes', [])
                         if len(outcomes) >= 2:
                             comparison['sportsbooks'][book_name] = {
@@ -350,73 +581,86 @@ class EnhancedPrizePicksWorkflow:
         
         # Calculate line advantage
         if comparison['sportsbooks']:
-            avg_line = sum(book['line'] for book in comparison['sportsbooks'].values()) / len(comparison['sportsbooks'])
+            books = comparison['sportsbooks']
+            avg_line = float(np.fromiter((book['line'] for book in books.values()),
+                                         dtype=np.float64, count=len(books)).mean())
             comparison['line_advantage'] = self._calculate_line_advantage(entry, avg_line)
             comparison['value_rating'] = self._rate_line_value(comparison['line_advantage'])
         
         return comparison
     
+    # Per-book line jitter and odds ranges (inclusive) for mock comparisons
+    MOCK_BOOKS = ('draftkings', 'fanduel', 'betmgm', 'caesars')
+    MOCK_LINE_LOW = np.array([-0.2, -0.15, -0.1, -0.25])
+    MOCK_LINE_HIGH = np.array([0.2, 0.15, 0.3, 0.1])
+    MOCK_ODDS_LOW = np.array([-125, -120, -118, -115])
+    MOCK_ODDS_HIGH = np.array([-105, -100, -108, -110])
+    
     def _create_mock_sportsbook_comparison(self, entry: PrizePicksEntry) -> Dict:
         """Create realistic mock sportsbook comparison"""
-        import random
-        
-        # Create realistic variations around the PrizePicks line
-        base_line = entry.line_value
-        
+        return self._create_mock_sportsbook_comparisons([entry])[0]
+    
+    def _create_mock_sportsbook_comparisons(self, entries: List[PrizePicksEntry]) -> List[Dict]:
+        """Mock comparisons for many entries from a single random draw"""
+        # Create realistic variations around each PrizePicks line: (N, books) lines, (N, 2, books) odds
+        shape = (len(entries), len(self.MOCK_BOOKS))
+        lines = np.array([entry.line_value for entry in entries])[:, None] + \
+            self._rng.uniform(self.MOCK_LINE_LOW, self.MOCK_LINE_HIGH, size=shape)
+        odds = self._rng.integers(self.MOCK_ODDS_LOW, self.MOCK_ODDS_HIGH + 1, size=(len(entries), 2, shape[1]))
+        
+        # Line advantage and rating for every entry at once
+        pp_lines = np.array([entry.line_value for entry in entries])
+        is_over = np.array([entry.bet_type == 'over' for entry in entries])
+        avg_lines = lines.mean(axis=1)
+        advantages = np.where(is_over, avg_lines - pp_lines, pp_lines - avg_lines)
+        ratings = self._rate_lines_vec(advantages)
+        
+        return [
+            self._build_mock_comparison(entry, lines[n], odds[n], float(advantages[n]), str(ratings[n]))
+            for n, entry in enumerate(entries)
+        ]
+    
+    def _build_mock_comparison(self, entry: PrizePicksEntry, lines: np.ndarray, odds: np.ndarray,
+                               line_advantage: float, value_rating: str) -> Dict:
+        """Assemble one mock comparison from its drawn lines and odds"""
         mock_sportsbook_data = {
-            'draftkings': {
-                'line': base_line + random.uniform(-0.2, 0.2),
-                'over_odds': random.randint(-125, -105),
-                'under_odds': random.randint(-125, -105)
-            },
-            'fanduel': {
-                'line': base_line + random.uniform(-0.15, 0.15),
-                'over_odds': random.randint(-120, -100),
-                'under_odds': random.randint(-120, -100)
-            },
-            'betmgm': {
-                'line': base_line + random.uniform(-0.1, 0.3),
-                'over_odds': random.randint(-118, -108),
-                'under_odds': random.randint(-118, -108)
-            },
-            'caesars': {
-                'line': base_line + random.uniform(-0.25, 0.1),
-                'over_odds': random.randint(-115, -110),
-                'under_odds': random.randint(-115, -110)
+            book: {
+                'line': float(lines[i]),
+                'over_odds': int(odds[0, i]),
+                'under_odds': int(odds[1, i])
             }
+            for i, book in enumerate(self.MOCK_BOOKS)
         }
         
-        # Calculate line advantage
-        avg_line = sum(book['line'] for book in mock_sportsbook_data.values()) / len(mock_sportsbook_data)
-        line_advantage = self._calculate_line_advantage(entry, avg_line)
-        
         return {
             'player': entry.player_name,
             'prop': entry.prop_type,
             'prizepicks_line': entry.line_value,
             'sportsbooks': mock_sportsbook_data,
             'line_advantage': line_advantage,
-            'value_rating': self._rate_line_value(line_advantage),
+            'value_rating': value_rating,
             'data_source': 'mock'
         }
     
+    # Sportsbook market key -> our prop type, plus the inverse for one-compare matching
+    _MARKET_MAPPINGS = {
+        'player_hits': 'hits',
+        'player_runs': 'runs',
+        'player_rbis': 'rbis',
+        'player_home_runs': 'home_runs',
+        'player_strikeouts': 'strikeouts',
+        'player_passing_yards': 'passing_yards',
+        'player_rushing_yards': 'rushing_yards',
+        'player_receiving_yards': 'receiving_yards',
+        'player_points': 'points',
+        'player_rebounds': 'rebounds',
+        'player_assists': 'assists'
+    }
+    _MARKET_KEY_BY_PROP = {prop: key for key, prop in _MARKET_MAPPINGS.items()}
+    
     def _matches_prop_type(self, market_key: str, prop_type: str) -> bool:
         """Check if sportsbook market matches our prop type"""
-        market_mappings = {
-            'player_hits': 'hits',
-            'player_runs': 'runs',
-            'player_rbis': 'rbis',
-            'player_home_runs': 'home_runs',
-            'player_strikeouts': 'strikeouts',
-            'player_passing_yards': 'passing_yards',
-            'player_rushing_yards': 'rushing_yards',
-            'player_receiving_yards': 'receiving_yards',
-            'player_points': 'points',
-            'player_rebounds': 'rebounds',
-            'player_assists': 'assists'
-        }
-        
-        return market_mappings.get(market_key) == prop_type
+        return self._MARKET_MAPPINGS.get(market_key) == prop_type
     
     def _calculate_line_advantage(self, entry: PrizePicksEntry, avg_sportsbook_line: float) -> float:
         """Calculate line advantage for PrizePicks vs sportsbooks"""
@@ -427,18 +671,21 @@ class EnhancedPrizePicksWorkflow:
             # For unders, higher lines are better
             return entry.line_value - avg_sportsbook_line
     
+    # Upper bounds (inclusive) of each rating band, worst to best
+    _LINE_THRESHOLDS = (-0.2, -0.1, 0.1, 0.2)
+    _LINE_LABELS = ('very_unfavorable', 'unfavorable', 'neutral', 'favorable', 'very_favorable')
+    _RATING_EMOJI = ('🔴', '🟠', '⚪', '🟡', '🟢')
+    _EMOJI_BY_RATING = dict(zip(_LINE_LABELS, _RATING_EMOJI))
+    
+    def _rate_lines_vec(self, line_advantages: np.ndarray) -> np.ndarray:
+        """Rate many line advantages at once"""
+        idx = np.digitize(line_advantages, self._LINE_THRESHOLDS, right=True)
+        return np.asarray(self._LINE_LABELS)[idx]
+    
     def _rate_line_value(self, line_advantage: float) -> str:
         """Rate the line value advantage"""
-        if line_advantage > 0.2:
-            return 'very_favorable'
-        elif line_advantage > 0.1:
-            return 'favorable'
-        elif line_advantage > -0.1:
-            return 'neutral'
-        elif line_advantage > -0.2:
-            return 'unfavorable'
-        else:
-            return 'very_unfavorable'
+        # bisect_left keeps each threshold in the lower band, like the > comparisons did
+        return self._LINE_LABELS[bisect.bisect_left(self._LINE_THRESHOLDS, line_advantage)]
     
     def _print_sportsbook_comparison(self, comparison: Dict):
         """Print individual sportsbook comparison"""
@@ -448,62 +695,77 @@ class EnhancedPrizePicksWorkflow:
         advantage = comparison['line_advantage']
         rating = comparison['value_rating']
         
-        rating_emoji = {
-            'very_favorable': '🟢',
-            'favorable': '🟡', 
-            'neutral': '⚪',
-            'unfavorable': '🟠',
-            'very_unfavorable': '🔴'
-        }
-        
-        print(f"\n{rating_emoji.get(rating, '⚪')} {player} {prop}")
-        print(f"   PrizePicks: {pp_line} | Advantage: {advantage:+.2f} | Rating: {rating}")
+        self._log("\n%s %s %s", self._EMOJI_BY_RATING.get(rating, '⚪'), player, prop)
+        self._log("   PrizePicks: %s | Advantage: %+.2f | Rating: %s", pp_line, advantage, rating)
         
         for book, data in comparison['sportsbooks'].items():
-            print(f"   {book.title()}: {data['line']} (O: {data['over_odds']:+d}, U: {data['under_odds']:+d})")
+            self._log("   %s: %s (O: %+d, U: %+d)", book.title(), data['line'], data['over_odds'], data['under_odds'])
+    
+    # Slip probability tiers: above 0.4 / 0.25 / 0.15 / otherwise, and the
+    # multiplier used when the table has no payout for that tier
+    MULTIPLIER_TIERS = np.array([0.4, 0.25, 0.15])
+    MULTIPLIER_FALLBACKS = np.array([2.0, 3.0, 5.0, 10.0])
     
     def _estimate_multiplier(self, entry_count: int, slip_probability: float) -> float:
         """Enhanced multiplier estimation"""
-        if entry_count < 2 or entry_count > 6:
-            return 2.0
-        
-        # More sophisticated multiplier estimation
-        base_multipliers = self.multiplier_table.get(entry_count, {})
-        
-        if slip_probability > 0.4:
-            return base_multipliers.get(entry_count, 2.0)
-        elif slip_probability > 0.25:
-            return base_multipliers.get(entry_count + 1, 3.0)
-        elif slip_probability > 0.15:
-            return base_multipliers.get(entry_count + 2, 5.0)
-        else:
-            return base_multipliers.get(entry_count + 3, 10.0)
+        return float(self._estimate_multipliers([entry_count], [slip_probability])[0])
+    
+    def _estimate_multipliers(self, entry_counts, slip_probabilities) -> np.ndarray:
+        """Vectorized multiplier estimation across many slips"""
+        counts = np.asarray(entry_counts, dtype=int)
+        probs = np.asarray(slip_probabilities, dtype=float)
+        
+        # Riskier slips step further along the row toward bigger payouts
+        offsets = np.searchsorted(-self.MULTIPLIER_TIERS, -probs, side='right')
+        in_table = (counts >= 2) & (counts <= 6)
+        rows = np.where(in_table, counts, 0)
+        multipliers = self._mult_table[rows, rows + offsets]
+        multipliers = np.where(np.isnan(multipliers), self.MULTIPLIER_FALLBACKS[offsets], multipliers)
+        return np.where(in_table, multipliers, 2.0)
     
     def _calculate_kelly_for_slip(self, win_probability: float, multiplier: float) -> float:
         """Calculate Kelly criterion for the entire slip"""
-        if win_probability <= 0 or multiplier <= 1:
-            return 0.0
-        
-        b = multiplier - 1
-        p = win_probability
-        q = 1 - win_probability
-        
-        kelly = (b * p - q) / b
-        return max(0, min(0.25, kelly))
+        return float(self._kelly_for_slips([win_probability], [multiplier])[0])
+    
+    def _slip_probabilities(self, entry_lists: List[List[PrizePicksEntry]]) -> np.ndarray:
+        """Probability that every pick hits, for each slip (short slips padded with p=1)"""
+        width = max(len(entries) for entries in entry_lists)
+        true_probs = np.ones((len(entry_lists), width))
+        is_over = np.ones((len(entry_lists), width), dtype=bool)
+        for i, entries in enumerate(entry_lists):
+            true_probs[i, :len(entries)] = [e.true_probability for e in entries]
+            is_over[i, :len(entries)] = [e.bet_type == 'over' for e in entries]
+        
+        return np.prod(np.where(is_over, true_probs, 1 - true_probs), axis=1)
+    
+    def _kelly_for_slips(self, win_probabilities, multipliers) -> np.ndarray:
+        """Vectorized Kelly fraction per slip, capped at 25%"""
+        p = np.asarray(win_probabilities, dtype=float)
+        multipliers = np.asarray(multipliers, dtype=float)
+        b = multipliers - 1
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            kelly = np.clip((b * p - (1 - p)) / b, 0, 0.25)
+        return np.where((p <= 0) | (multipliers <= 1), 0.0, kelly)
     
     def _generate_slip_recommendation(self, entries: List[PrizePicksEntry], 
                                     slip_probability: float, expected_value: float, 
                                     kelly_fraction: float) -> str:
         """Enhanced slip recommendation with API data quality consideration"""
         
-        # Count recommendation types
-        strong_picks = sum(1 for e in entries if e.recommendation == 'STRONG_BET')
-        moderate_picks = sum(1 for e in entries if e.recommendation == 'MODERATE_BET')
-        weak_picks = sum(1 for e in entries if e.recommendation == 'WEAK_BET')
-        avoid_picks = sum(1 for e in entries if e.recommendation in ['AVOID', 'STRONG_AVOID'])
+        # Count recommendation types and API-backed picks in one pass
+        counts = Counter()
+        api_picks = 0
+        for e in entries:
+            counts[e.recommendation] += 1
+            api_picks += e.data_source[:3] == 'api'
+        
+        strong_picks = counts['STRONG_BET']
+        moderate_picks = counts['MODERATE_BET']
+        weak_picks = counts['WEAK_BET']
+        avoid_picks = counts['AVOID'] + counts['STRONG_AVOID']
         
         # Check data quality
-        api_picks = sum(1 for e in entries if e.data_source.startswith('api'))
         data_quality_multiplier = 1.0 + (api_picks / len(entries) * 0.2)  # Boost for real API data
         
         # Enhanced recommendation logic
@@ -526,52 +788,54 @@ class EnhancedPrizePicksWorkflow:
     
     def _print_enhanced_slip_analysis(self, slip: PrizePicksSlip):
         """Print enhanced slip analysis with API information"""
-        print(f"\n🎯 ENHANCED SLIP ANALYSIS")
-        print(f"{'='*60}")
+        self._log("\n🎯 ENHANCED SLIP ANALYSIS")
+        self._log("=" * 60)
         
-        print(f"📋 INDIVIDUAL PICKS:")
+        self._log("📋 INDIVIDUAL PICKS:")
         for i, entry in enumerate(slip.entries, 1):
             api_indicator = "🌐" if entry.data_source.startswith('api') else "📝"
-            print(f"   {i}. {api_indicator} {entry.player_name} [{entry.api_source}]")
-            print(f"      {entry.bet_type.title()} {entry.line_value} {entry.prop_type}")
-            print(f"      Confidence: {entry.confidence_score:.1%} | Rec: {entry.recommendation}")
+            self._log("   %s. %s %s [%s]", i, api_indicator, entry.player_name, entry.api_source)
+            self._log("      %s %s %s", entry.bet_type.title(), entry.line_value, entry.prop_type)
+            self._log("      Confidence: %.1f%% | Rec: %s", entry.confidence_score * 100, entry.recommendation)
         
-        print(f"\n🌐 API USAGE SUMMARY:")
-        print(f"   APIs Used: {slip.total_apis_used}")
-        print(f"   Success Rate: {slip.api_success_rate:.1f}%")
-        print(f"   Sports Covered: {len(self.api_stats['sports_covered'])}")
+        self._log("\n🌐 API USAGE SUMMARY:")
+        self._log("   APIs Used: %s", slip.total_apis_used)
+        self._log("   Success Rate: %.1f%%", slip.api_success_rate)
+        self._log("   Sports Covered: %s", len(self.api_stats['sports_covered']))
         
-        print(f"\n📊 SLIP METRICS:")
-        print(f"   Total Picks: {slip.entry_count}")
-        print(f"   Slip Probability: {slip.slip_probability:.1%}")
-        print(f"   Multiplier: {slip.multiplier}x")
-        print(f"   Expected Payout: ${slip.estimated_payout:.2f}")
-        print(f"   Expected Value: ${slip.slip_expected_value:.2f}")
-        print(f"   Kelly Fraction: {slip.kelly_fraction:.1%}")
+        self._log("\n📊 SLIP METRICS:")
+        self._log("   Total Picks: %s", slip.entry_count)
+        self._log("   Slip Probability: %.1f%%", slip.slip_probability * 100)
+        self._log("   Multiplier: %sx", slip.multiplier)
+        self._log("   Expected Payout: $%.2f", slip.estimated_payout)
+        self._log("   Expected Value: $%.2f", slip.slip_expected_value)
+        self._log("   Kelly Fraction: %.1f%%", slip.kelly_fraction * 100)
         
-        print(f"\n🎯 FINAL RECOMMENDATION: {slip.recommendation}")
+        self._log("\n🎯 FINAL RECOMMENDATION: %s", slip.recommendation)
         
         # Enhanced recommendation explanation
         if slip.recommendation == "STRONG_PLAY":
-            print("   ✅ Strong positive EV with high-quality data!")
+            self._log("   ✅ Strong positive EV with high-quality data!")
         elif slip.recommendation == "MODERATE_PLAY":
-            print("   ⚠️ Moderate value - consider smaller stake")
+            self._log("   ⚠️ Moderate value - consider smaller stake")
         elif slip.recommendation == "WEAK_PLAY":
-            print("   ⚠️ Weak value - proceed with caution")
+            self._log("   ⚠️ Weak value - proceed with caution")
         else:
-            print("   ❌ Avoid this slip - negative expected value")
+            self._log("   ❌ Avoid this slip - negative expected value")
     
     def get_api_usage_report(self) -> Dict:
         """Get detailed API usage report"""
+        apis_used = frozenset(self.api_stats['apis_used'])
+        sports_covered = frozenset(self.api_stats['sports_covered'])
         return {
             'total_requests': self.api_stats['total_requests'],
             'successful_requests': self.api_stats['successful_requests'],
             'failed_requests': self.api_stats['failed_requests'],
             'success_rate': (self.api_stats['successful_requests'] / 
                            max(self.api_stats['total_requests'], 1)) * 100,
-            'unique_apis_used': len(self.api_stats['apis_used']),
-            'apis_used': list(self.api_stats['apis_used']),
-            'sports_covered': list(self.api_stats['sports_covered']),
+            'unique_apis_used': len(apis_used),
+            'apis_used': apis_used,
+            'sports_covered': sports_covered,
             'generated_at': datetime.now().isoformat()
         }
 
@@ -579,8 +843,8 @@ class EnhancedPrizePicksWorkflow:
 # Enhanced test function
 def enhanced_test():
     """Enhanced test with real API integration"""
-    print("🎯 Enhanced PrizePicks Workflow Test with Multi-API Support")
-    print("="*70)
+    log.info("🎯 Enhanced PrizePicks Workflow Test with Multi-API Support")
+    log.info("=" * 70)
     
     # Test with real APIs (set to False for mock data)
     USE_REAL_APIS = True
@@ -602,14 +866,15 @@ def enhanced_test():
         sportsbook_analysis = workflow.compare_with_sportsbooks(slip.entries)
         
         # Print API usage report
-        print(f"\n📊 API USAGE REPORT:")
+        log.info("\n📊 API USAGE REPORT:")
         api_report = workflow.get_api_usage_report()
-        print(f"   Total API Calls: {api_report['total_requests']}")
-        print(f"   Success Rate: {api_report['success_rate']:.1f}%")
-        print(f"   APIs Used: {', '.join(api_report['apis_used'])}")
-        print(f"   Sports Covered: {', '.join(api_report['sports_covered'])}")
+        log.info("   Total API Calls: %s", api_report['total_requests'])
+        log.info("   Success Rate: %.1f%%", api_report['success_rate'])
+        log.info("   APIs Used: %s", ', '.join(api_report['apis_used']))
+        log.info("   Sports Covered: %s", ', '.join(api_report['sports_covered']))
     
     return slip
 
 if __name__ == "__main__":
+    setup_logging()
     enhanced_test()
\ No newline at end of file
@@ -1,118 +1,369 @@
+import csv
+import io
+import logging
 import re
+import sys
+import numpy as np
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from config import Config
 
-class PropParser:
-    def __init__(self):
-        self.sport_keywords = {
-            "MLB": ["baseball", "mlb", "runs", "hits", "strikeouts", "home runs", "rbis", "stolen bases", 
-                   "innings", "inning", "era", "whip", "allowed", "walks", "saves", "holds"],
-            "NFL": ["football", "nfl", "yards", "touchdowns", "passing", "rushing", "receiving", "receptions",
-                   "completions", "attempts", "interceptions", "fumbles", "sacks"],
-            "NBA": ["basketball", "nba", "points", "rebounds", "assists", "steals", "blocks", "three pointers",
-                   "field goals", "free throws", "turnovers", "minutes"],
-            "NHL": ["hockey", "nhl", "goals", "assists", "saves", "shots", "penalty minutes", "hits",
-                   "faceoff", "plus minus", "time on ice"],
-            "MMA": ["mma", "ufc", "strikes", "takedowns", "submission", "knockdowns", "significant strikes"],
-            "BOXING": ["boxing", "punches", "knockdowns", "rounds", "jabs", "power punches"],
-            "GOLF": ["golf", "birdies", "eagles", "pars", "bogeys", "driving distance", "fairways",
-                    "greens in regulation", "putts"],
-            # Esports
-            "COD": ["cod", "call of duty", "map", "kills", "deaths", "assists", "kd ratio"],
-            "CS2": ["cs2", "counter-strike", "maps", "kills", "deaths", "assists", "adr"],
-            "LOL": ["lol", "league of legends", "assists", "kills", "deaths", "cs", "gold"],
-            "VAL": ["val", "valorant", "kills", "deaths", "assists", "rounds"],
-            "R6": ["r6", "rainbow six", "kills", "deaths", "assists"],
-            "DOTA2": ["dota2", "dota", "kills", "deaths", "assists", "last hits"],
-            "RL": ["rl", "rocket league", "goals", "saves", "demos", "shots"],
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+log = logging.getLogger(__name__)
+
+# Slotted dataclasses (no per-instance __dict__) where the interpreter supports them
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**DATACLASS_SLOTS)
+class Prop:
+    """Single parsed prop"""
+    player_name: str
+    sport: str
+    prop_type: str
+    line_value: float
+    bet_type: str
+    odds: Optional[str]
+    raw_input: str
+    original_prop_type: str  # Keep original for reference
+    parsed_at: str
+    
+    def to_dict(self) -> Dict:
+        """Plain dict form, as returned by the parse_* methods"""
+        return {
+            'player_name': self.player_name,
+            'sport': self.sport,
+            'prop_type': self.prop_type,
+            'line_value': self.line_value,
+            'bet_type': self.bet_type,
+            'odds': self.odds,
+            'raw_input': self.raw_input,
+            'original_prop_type': self.original_prop_type,
+            'parsed_at': self.parsed_at
         }
 
-        # Enhanced regex patterns for different prop formats
-        self.patterns = [
-            # Pattern 1: Standard format - "Mike Trout Over 1.5 Hits +120"
-            re.compile(
-                r"^(?P<player_name>[A-Za-z .'-]+)\s+"
-                r"(?P<bet_type>Over|Under|More|Less|O|U)\s+"
-                r"(?P<line_value>\d+(\.\d+)?)\s+"
-                r"(?P<prop_type>.+?)"
-                r"(?:\s+(?P<odds>[+-]\d+))?$",
-                re.IGNORECASE
-            ),
-            
-            # Pattern 2: Complex prop format - "Luis Castillo + Jack Leiter Over 0.5 1st Inning Runs Allowed"
-            re.compile(
-                r"^(?P<player_name>[A-Za-z .'+&-]+)\s+"
-                r"(?P<bet_type>Over|Under|More|Less|O|U)\s+"
-                r"(?P<line_value>\d+(\.\d+)?)\s+"
-                r"(?P<prop_type>.+?)$",
-                re.IGNORECASE
-            ),
-            
-            # Pattern 3: PrizePicks style - "Player Name Prop Type More/Less Line"
-            re.compile(
-                r"^(?P<player_name>[A-Za-z .'+&-]+)\s+"
-                r"(?P<prop_type>(?:1st\s+)?(?:\w+\s+)*\w+)\s+"
-                r"(?P<bet_type>More|Less|Over|Under)\s+"
-                r"(?P<line_value>\d+(\.\d+)?)$",
-                re.IGNORECASE
-            ),
-            
-            # Pattern 4: Reverse order - "Over 1.5 Hits Mike Trout"
-            re.compile(
-                r"^(?P<bet_type>Over|Under|More|Less|O|U)\s+"
-                r"(?P<line_value>\d+(\.\d+)?)\s+"
-                r"(?P<prop_type>[A-Za-z0-9 _-]+?)\s+"
-                r"(?P<player_name>[A-Za-z .'+&-]+)$",
-                re.IGNORECASE
-            )
-        ]
+# Every prop pattern needs one of these as a whole word; lines without one skip the regexes
+_DIRECTION_WORDS = frozenset({'over', 'under', 'more', 'less', 'o', 'u'})
+_DIRECTION_RE = re.compile(r'\b(?:%s)\b' % '|'.join(sorted(_DIRECTION_WORDS)), re.IGNORECASE)
+
+# Spaces and hyphens become underscores and apostrophes are dropped; '+' expands
+# to '_plus_', so it is replaced separately
+_PROP_TYPE_TRANSLATION = str.maketrans({' ': '_', '-': '_', "'": None})
+_MULTI_UNDERSCORE = re.compile(r'_{2,}')
+
+# Fallback stat words per sport when no sport keyword matched, checked in this order.
+# 'field' sends "field goals" to NBA before the NHL 'goals' hint is reached.
+_MLB_HINTS = frozenset({'inning', 'runs', 'hits', 'strikeouts', 'era'})
+_NFL_HINTS = frozenset({'yards', 'touchdowns', 'receptions', 'completions'})
+_NBA_HINTS = frozenset({'points', 'rebounds', 'assists', 'field'})
+_NHL_HINTS = frozenset({'goals', 'saves', 'shots', 'assists'})
+
+# Prop type aliases -> canonical stat names
+_NORMALIZATIONS: Dict[str, str] = {
+    # MLB - Enhanced with inning-specific props
+    "hits": "hits",
+    "runs": "runs",
+    "runs allowed": "runs_allowed",
+    "1st inning runs allowed": "runs_allowed_1st_inning",
+    "first inning runs allowed": "runs_allowed_1st_inning",
+    "1st inning runs": "runs_1st_inning",
+    "rbis": "rbis", 
+    "rbi": "rbis",
+    "home runs": "home_runs",
+    "home run": "home_runs",
+    "hr": "home_runs",
+    "strikeouts": "strikeouts",
+    "k": "strikeouts",
+    "ks": "strikeouts",
+    "stolen bases": "stolen_bases",
+    "sb": "stolen_bases",
+    "walks": "walks",
+    "bb": "walks",
+    "total bases": "total_bases",
+    "tb": "total_bases",
+    "era": "era",
+    "earned run average": "era",
+    "whip": "whip",
+    "innings pitched": "innings_pitched",
+    "ip": "innings_pitched",
+    
+    # NFL
+    "passing yards": "passing_yards",
+    "rushing yards": "rushing_yards", 
+    "receiving yards": "receiving_yards",
+    "receptions": "receptions",
+    "rec": "receptions",
+    "touchdowns": "touchdowns",
+    "touchdown": "touchdowns",
+    "passing touchdowns": "passing_touchdowns",
+    "rushing touchdowns": "rushing_touchdowns",
+    "receiving touchdowns": "receiving_touchdowns",
+    "completions": "completions",
+    "comp": "completions",
+    "attempts": "attempts",
+    "att": "attempts",
+    "interceptions": "interceptions",
+    "int": "interceptions",
+    
+    # NBA
+    "points": "points",
+    "pts": "points",
+    "rebounds": "rebounds",
+    "reb": "rebounds",
+    "assists": "assists",
+    "ast": "assists",
+    "steals": "steals",
+    "stl": "steals",
+    "blocks": "blocks",
+    "blk": "blocks",
+    "three pointers": "three_pointers",
+    "threes": "three_pointers",
+    "3pm": "three_pointers",
+    "field goals": "field_goals",
+    "fg": "field_goals",
+    "free throws": "free_throws",
+    "ft": "free_throws",
+    "turnovers": "turnovers",
+    "to": "turnovers",
+    "double double": "double_double",
+    "triple double": "triple_double",
+    
+    # NHL
+    "goals": "goals",
+    "shots": "shots",
+    "sog": "shots",
+    "saves": "saves",
+    "sv": "saves",
+    "penalty minutes": "penalty_minutes",
+    "pim": "penalty_minutes",
+    "blocked shots": "blocked_shots",
+    "faceoff wins": "faceoff_wins",
+    "fow": "faceoff_wins",
+    
+    # MMA/Boxing
+    "strikes landed": "strikes_landed",
+    "significant strikes": "significant_strikes",
+    "takedowns": "takedowns",
+    "td": "takedowns",
+    "submission attempts": "submission_attempts",
+    "knockdowns": "knockdowns",
+    "punches landed": "punches_landed",
+    "rounds won": "rounds_won",
+    
+    # Golf
+    "birdies": "birdies",
+    "eagles": "eagles",
+    "pars": "pars",
+    "bogeys": "bogeys",
+    "driving distance": "driving_distance",
+    "fairways hit": "fairways_hit",
+    "greens in regulation": "greens_in_regulation",
+    "gir": "greens_in_regulation",
+    "putts": "putts",
+    
+    # Esports
+    "kills": "kills",
+    "deaths": "deaths",
+    "maps won": "maps_won",
+    "damage": "damage",
+    "adr": "adr",
+    "kd ratio": "kd_ratio",
+    "kda": "kda"
+}
+
+# Aliases that mean different stats depending on the sport, e.g. "td"
+_SPORT_NORMALIZATIONS: Dict[Tuple[str, str], str] = {
+    ("NFL", "td"): "touchdowns",
+}
+
+def _compile_matcher(words):
+    """Compile words into one matcher that finds all of them in a single pass over a text"""
+    if AHOCORASICK_AVAILABLE:
+        matcher = ahocorasick.Automaton()
+        for word in words:
+            matcher.add_word(word, word)
+        matcher.make_automaton()
+        return matcher
+    # Lookahead so overlapping words are all seen; longest first at each position
+    alternation = "|".join(map(re.escape, sorted(words, key=len, reverse=True)))
+    return re.compile(f"(?=({alternation}))")
+
+def _find_words(matcher, text: str):
+    """Yield every word from a _compile_matcher matcher found in text"""
+    if AHOCORASICK_AVAILABLE:
+        for _, word in matcher.iter(text):
+            yield word
+    else:
+        for match in matcher.finditer(text):
+            yield match.group(1)
+
+def _build_keyword_matcher(sport_keywords: Dict[str, List[str]]):
+    """Map every sport keyword to its sport, plus an automaton over them when pyahocorasick is installed"""
+    # A keyword shared by several sports belongs to the first one listed
+    keyword_sport = {}
+    for priority, (sport, keywords) in enumerate(sport_keywords.items()):
+        for keyword in keywords:
+            keyword_sport.setdefault(keyword, (priority, sport))
+    # Without the automaton detect_sport scans _SPORT_KW instead
+    return keyword_sport, _compile_matcher(keyword_sport) if AHOCORASICK_AVAILABLE else None
+
+# Shared pieces of the prop patterns
+_BET_TYPE = r"(?P<bet_type>Over|Under|More|Less|O|U)"
+_LINE_VALUE = r"(?P<line_value>\d+(\.\d+)?)"
+
+# Enhanced regex patterns for different prop formats, compiled once per process
+_PROP_PATTERNS = (
+    # Pattern 1: Standard format - "Mike Trout Over 1.5 Hits +120"
+    re.compile(
+        r"^(?P<player_name>[A-Za-z .'-]+)\s+"
+        + _BET_TYPE + r"\s+"
+        + _LINE_VALUE + r"\s+"
+        r"(?P<prop_type>.+?)"
+        r"(?:\s+(?P<odds>[+-]\d+))?$",
+        re.IGNORECASE
+    ),
+    
+    # Pattern 2: Complex prop format - "Luis Castillo + Jack Leiter Over 0.5 1st Inning Runs Allowed"
+    re.compile(
+        r"^(?P<player_name>[A-Za-z .'+&-]+)\s+"
+        + _BET_TYPE + r"\s+"
+        + _LINE_VALUE + r"\s+"
+        r"(?P<prop_type>.+?)$",
+        re.IGNORECASE
+    ),
+    
+    # Pattern 3: PrizePicks style - "Player Name Prop Type More/Less Line" (no O/U shorthand here)
+    re.compile(
+        r"^(?P<player_name>[A-Za-z .'+&-]+)\s+"
+        r"(?P<prop_type>(?:1st\s+)?(?:\w+\s+)*\w+)\s+"
+        r"(?P<bet_type>More|Less|Over|Under)\s+"
+        + _LINE_VALUE + r"$",
+        re.IGNORECASE
+    ),
+    
+    # Pattern 4: Reverse order - "Over 1.5 Hits Mike Trout"
+    re.compile(
+        r"^" + _BET_TYPE + r"\s+"
+        + _LINE_VALUE + r"\s+"
+        r"(?P<prop_type>[A-Za-z0-9 _-]+?)\s+"
+        r"(?P<player_name>[A-Za-z .'+&-]+)$",
+        re.IGNORECASE
+    )
+)
+
+def _combine_patterns(patterns) -> re.Pattern:
+    """Join the prop patterns into one alternation tried in the same order.
+    
+    Group names get a ``__<n>`` suffix so they stay unique, and each alternative
+    is wrapped in an ``alt<n>`` group so the match reports which one hit.
+    """
+    alternatives = []
+    for n, pattern in enumerate(patterns, 1):
+        source = re.sub(r"\(\?P<(\w+)>", rf"(?P<\1__{n}>", pattern.pattern)
+        alternatives.append(f"(?P<alt{n}>{source})")
+    return re.compile("|".join(alternatives), re.IGNORECASE)
+
+# Position of each alias in the table, used to break ties between equally long partial matches
+_NORMALIZATION_ORDER = {key: i for i, key in enumerate(_NORMALIZATIONS)}
+_NORMALIZATION_MATCHER = _compile_matcher(_NORMALIZATIONS)
+
+class PropParser:
+    # Sport keywords and regex patterns are built once at import
+    # and shared by every parser instance
+    SPORT_KEYWORDS = {
+        "MLB": ["baseball", "mlb", "runs", "hits", "strikeouts", "home runs", "rbis", "stolen bases", 
+               "innings", "inning", "era", "whip", "allowed", "walks", "saves", "holds"],
+        "NFL": ["football", "nfl", "yards", "touchdowns", "passing", "rushing", "receiving", "receptions",
+               "completions", "attempts", "interceptions", "fumbles", "sacks"],
+        "NBA": ["basketball", "nba", "points", "rebounds", "assists", "steals", "blocks", "three pointers",
+               "field goals", "free throws", "turnovers", "minutes"],
+        "NHL": ["hockey", "nhl", "goals", "assists", "saves", "shots", "penalty minutes", "hits",
+               "faceoff", "plus minus", "time on ice"],
+        "MMA": ["mma", "ufc", "strikes", "takedowns", "submission", "knockdowns", "significant strikes"],
+        "BOXING": ["boxing", "punches", "knockdowns", "rounds", "jabs", "power punches"],
+        "GOLF": ["golf", "birdies", "eagles", "pars", "bogeys", "driving distance", "fairways",
+                "greens in regulation", "putts"],
+        # Esports
+        "COD": ["cod", "call of duty", "map", "kills", "deaths", "assists", "kd ratio"],
+        "CS2": ["cs2", "counter-strike", "maps", "kills", "deaths", "assists", "adr"],
+        "LOL": ["lol", "league of legends", "assists", "kills", "deaths", "cs", "gold"],
+        "VAL": ["val", "valorant", "kills", "deaths", "assists", "rounds"],
+        "R6": ["r6", "rainbow six", "kills", "deaths", "assists"],
+        "DOTA2": ["dota2", "dota", "kills", "deaths", "assists", "last hits"],
+        "RL": ["rl", "rocket league", "goals", "saves", "demos", "shots"],
+    }
+
+    PATTERNS = _PROP_PATTERNS
+
+    COMBINED_PATTERN = _combine_patterns(PATTERNS)
+    _keyword_sport, _keyword_matcher = _build_keyword_matcher(SPORT_KEYWORDS)
+    # Flat (keyword, sport) pairs, longest keyword first; the stable sort keeps sport order for ties
+    _SPORT_KW = tuple(sorted(((keyword, sport) for keyword, (_, sport) in _keyword_sport.items()),
+                             key=lambda item: -len(item[0])))
+    CSV_HEADER_HINTS = ('player', 'sport', 'prop')
+    FORMAT_SAMPLE_CHARS = 4096
+
+    def _match_keywords(self, text: str):
+        """Yield every sport keyword found in text"""
+        return _find_words(self._keyword_matcher, text)
 
     def parse_manual_input(self, input_text: str) -> List[Dict]:
         """Parse manually copied prop data"""
         props = []
         lines = input_text.strip().split('\n')
+        # One timestamp for the whole batch
+        parsed_at = datetime.now().isoformat()
         for line in lines:
-            if not line.strip():
+            line = line.strip()
+            if not line:
                 continue
-            prop = self.parse_single_prop(line.strip())
+            prop = self.parse_single_prop(line, parsed_at)
             if prop:
                 props.append(prop)
         return props
 
-    def parse_single_prop(self, line: str) -> Optional[Dict]:
-        """Parse a single prop line using multiple patterns"""
+    def parse_single_prop(self, line: str, parsed_at: Optional[str] = None,
+                          tokens: Optional[List[str]] = None) -> Optional[Dict]:
+        """Parse a single prop line using multiple patterns; tokens is line.split() if already known"""
         # Clean up the input
         line = line.strip()
         
-        # Try each pattern
-        for i, pattern in enumerate(self.patterns):
-            match = pattern.match(line)
-            if match:
-                print(f"✅ Matched pattern {i+1}: {line}")
-                return self.extract_prop_data(match, line)
+        # No direction word means no pattern can match
+        if _DIRECTION_RE.search(line) is None:
+            return self.manual_parse_fallback(line, parsed_at, tokens)
+        
+        # Try every pattern in one match; lastgroup names the alternative that hit
+        match = self.COMBINED_PATTERN.match(line)
+        if match:
+            log.debug("✅ Matched pattern %s: %s", match.lastgroup[3:], line)
+            return self.extract_prop_data(match, line, parsed_at)
         
         # If no patterns match, try manual parsing for special cases
-        return self.manual_parse_fallback(line)
+        return self.manual_parse_fallback(line, parsed_at, tokens)
 
-    def manual_parse_fallback(self, line: str) -> Optional[Dict]:
+    def manual_parse_fallback(self, line: str, parsed_at: Optional[str] = None,
+                              tokens: Optional[List[str]] = None) -> Optional[Dict]:
         """Fallback manual parsing for edge cases"""
         # Handle cases like "Luis Castillo + Jack Leiter Over 0.5 1st Inning Runs Allowed"
-        parts = line.split()
+        parts = tokens if tokens is not None else line.split()
         
         # Look for Over/Under/More/Less
-        direction_words = ['over', 'under', 'more', 'less', 'o', 'u']
         direction_idx = None
         direction = None
         
         for i, part in enumerate(parts):
-            if part.lower() in direction_words:
+            if part.lower() in _DIRECTION_WORDS:
                 direction_idx = i
                 direction = part.lower()
                 break
         
         if direction_idx is None:
-            print(f"⚠️ Could not find direction (Over/Under) in: {line}")
+            log.warning("⚠️ Could not find direction (Over/Under) in: %s", line)
             return None
         
         # Look for line value (number after direction)
@@ -128,7 +379,7 @@ class PropParser:
                 continue
         
         if line_value is None:
-            print(f"⚠️ Could not find line value in: {line}")
+            log.warning("⚠️ Could not find line value in: %s", line)
             return None
         
         # Player name is everything before direction
@@ -138,15 +389,17 @@ class PropParser:
         prop_type = ' '.join(parts[line_value_idx + 1:]).strip() if line_value_idx + 1 < len(parts) else 'unknown'
         
         if not player_name:
-            print(f"⚠️ Could not extract player name from: {line}")
+            log.warning("⚠️ Could not extract player name from: %s", line)
             return None
         
         # Create the prop data
-        return self.create_prop_dict(player_name, direction, line_value, prop_type, None, line)
+        return self.create_prop_dict(player_name, direction, line_value, prop_type, None, line, parsed_at)
 
-    def extract_prop_data(self, match, line: str) -> Dict:
+    def extract_prop_data(self, match, line: str, parsed_at: Optional[str] = None) -> Dict:
         """Extract prop data from regex match"""
-        data = match.groupdict()
+        # Drop the __<n> suffix COMBINED_PATTERN adds, keeping only the groups that matched
+        data = {name.partition('__')[0]: value for name, value in match.groupdict().items()
+                if value is not None}
         
         player_name = data['player_name'].strip()
         direction = data['bet_type'].lower()
@@ -154,11 +407,20 @@ class PropParser:
         prop_type = data['prop_type'].strip()
         odds = data.get('odds') if data.get('odds') else None
         
-        return self.create_prop_dict(player_name, direction, line_value, prop_type, odds, line)
+        return self.create_prop_dict(player_name, direction, line_value, prop_type, odds, line, parsed_at)
 
     def create_prop_dict(self, player_name: str, direction: str, line_value: float, 
-                        prop_type: str, odds: Optional[str], raw_input: str) -> Dict:
-        """Create standardized prop dictionary"""
+                        prop_type: str, odds: Optional[str], raw_input: str,
+                        parsed_at: Optional[str] = None) -> Optional[Dict]:
+        """Create standardized prop dictionary, or None if it fails validation"""
+        # Callers add their own keys (ids, odds overrides), so the parse_* methods keep returning dicts
+        prop = self.create_prop(player_name, direction, line_value, prop_type, odds, raw_input, parsed_at)
+        return prop.to_dict() if prop else None
+
+    def create_prop(self, player_name: str, direction: str, line_value: float,
+                    prop_type: str, odds: Optional[str], raw_input: str,
+                    parsed_at: Optional[str] = None) -> Optional[Prop]:
+        """Create a standardized Prop, or None if it fails validation; parsed_at defaults to now"""
         
         # Normalize direction
         if direction in ['more', 'o']:
@@ -170,19 +432,27 @@ class PropParser:
         sport = self.detect_sport(prop_type, player_name)
         normalized_prop_type = self.normalize_prop_type(prop_type, sport)
 
-        prop = {
-            'player_name': player_name,
-            'sport': sport,
-            'prop_type': normalized_prop_type,
-            'line_value': line_value,
-            'bet_type': direction,
-            'odds': odds,
-            'raw_input': raw_input,
-            'original_prop_type': prop_type,  # Keep original for reference
-            'parsed_at': datetime.now().isoformat()
-        }
+        # Same checks as validate_prop, on the locals before anything is built
+        if not (player_name and sport and normalized_prop_type):
+            log.warning("❌ Missing required field in: %s", raw_input)
+            return None
+        if line_value <= 0:
+            log.warning("❌ Invalid line value: %s", line_value)
+            return None
+
+        prop = Prop(
+            player_name=player_name,
+            sport=sport,
+            prop_type=normalized_prop_type,
+            line_value=line_value,
+            bet_type=direction,
+            odds=odds,
+            raw_input=raw_input,
+            original_prop_type=prop_type,
+            parsed_at=parsed_at or datetime.now().isoformat()
+        )
 
-        print(f"✅ Parsed: {player_name} {direction} {line_value} {prop_type} ({sport})")
+        log.debug("✅ Parsed: %s %s %s %s (%s)", player_name, direction, line_value, prop_type, sport)
         return prop
 
     def detect_sport(self, prop_type: str, player_name: str = "") -> str:
@@ -190,203 +460,96 @@ class PropParser:
         prop_lower = prop_type.lower()
         name_lower = player_name.lower()
         
-        # Check for sport-specific keywords in prop type
-        for sport, keywords in self.sport_keywords.items():
-            for keyword in keywords:
+        # Check for sport-specific keywords in prop type; the longest keyword wins,
+        # ties go to the sport listed first
+        if AHOCORASICK_AVAILABLE:
+            best = max(self._match_keywords(prop_lower),
+                       key=lambda kw: (len(kw), -self._keyword_sport[kw][0]), default=None)
+            if best is not None:
+                return self._keyword_sport[best][1]
+        else:
+            # Longest keywords come first, so the first hit is the longest match
+            for keyword, sport in self._SPORT_KW:
                 if keyword in prop_lower:
                     return sport
         
         # Check for known player patterns (you could expand this with a player database)
         # For now, we'll make educated guesses based on common patterns
-        if any(word in prop_lower for word in ['inning', 'runs', 'hits', 'strikeouts', 'era']):
+        tokens = set(prop_lower.split())
+        if _MLB_HINTS & tokens:
             return "MLB"
-        elif any(word in prop_lower for word in ['yards', 'touchdowns', 'receptions', 'completions']):
+        elif _NFL_HINTS & tokens:
             return "NFL"
-        elif any(word in prop_lower for word in ['points', 'rebounds', 'assists', 'field goals']):
+        elif _NBA_HINTS & tokens:
             return "NBA"
-        elif any(word in prop_lower for word in ['goals', 'saves', 'shots', 'assists']) and 'field goals' not in prop_lower:
+        elif _NHL_HINTS & tokens:
             return "NHL"
         
-        return "MLB"  # Default to MLB if uncertain
+        return "UNKNOWN"
 
     def normalize_prop_type(self, prop_type: str, sport: str) -> str:
         """Normalize prop type to standard format"""
         prop_lower = prop_type.lower().strip()
         
-        # Enhanced normalizations with more specific patterns
-        normalizations = {
-            # MLB - Enhanced with inning-specific props
-            "hits": "hits",
-            "runs": "runs",
-            "runs allowed": "runs_allowed",
-            "1st inning runs allowed": "runs_allowed_1st_inning",
-            "first inning runs allowed": "runs_allowed_1st_inning",
-            "1st inning runs": "runs_1st_inning",
-            "rbis": "rbis", 
-            "rbi": "rbis",
-            "home runs": "home_runs",
-            "home run": "home_runs",
-            "hr": "home_runs",
-            "strikeouts": "strikeouts",
-            "k": "strikeouts",
-            "ks": "strikeouts",
-            "stolen bases": "stolen_bases",
-            "sb": "stolen_bases",
-            "walks": "walks",
-            "bb": "walks",
-            "total bases": "total_bases",
-            "tb": "total_bases",
-            "era": "era",
-            "earned run average": "era",
-            "whip": "whip",
-            "innings pitched": "innings_pitched",
-            "ip": "innings_pitched",
-            
-            # NFL
-            "passing yards": "passing_yards",
-            "rushing yards": "rushing_yards", 
-            "receiving yards": "receiving_yards",
-            "receptions": "receptions",
-            "rec": "receptions",
-            "touchdowns": "touchdowns",
-            "touchdown": "touchdowns",
-            "td": "touchdowns",
-            "passing touchdowns": "passing_touchdowns",
-            "rushing touchdowns": "rushing_touchdowns",
-            "receiving touchdowns": "receiving_touchdowns",
-            "completions": "completions",
-            "comp": "completions",
-            "attempts": "attempts",
-            "att": "attempts",
-            "interceptions": "interceptions",
-            "int": "interceptions",
-            
-            # NBA
-            "points": "points",
-            "pts": "points",
-            "rebounds": "rebounds",
-            "reb": "rebounds",
-            "assists": "assists",
-            "ast": "assists",
-            "steals": "steals",
-            "stl": "steals",
-            "blocks": "blocks",
-            "blk": "blocks",
-            "three pointers": "three_pointers",
-            "threes": "three_pointers",
-            "3pm": "three_pointers",
-            "field goals": "field_goals",
-            "fg": "field_goals",
-            "free throws": "free_throws",
-            "ft": "free_throws",
-            "turnovers": "turnovers",
-            "to": "turnovers",
-            "double double": "double_double",
-            "triple double": "triple_double",
-            
-            # NHL
-            "goals": "goals",
-            "assists": "assists",
-            "points": "points" if sport != "NBA" else "points",
-            "shots": "shots",
-            "sog": "shots",
-            "saves": "saves",
-            "sv": "saves",
-            "penalty minutes": "penalty_minutes",
-            "pim": "penalty_minutes",
-            "hits": "hits" if sport == "NHL" else "hits",
-            "blocked shots": "blocked_shots",
-            "faceoff wins": "faceoff_wins",
-            "fow": "faceoff_wins",
-            
-            # MMA/Boxing
-            "strikes landed": "strikes_landed",
-            "significant strikes": "significant_strikes",
-            "takedowns": "takedowns",
-            "td": "takedowns",
-            "submission attempts": "submission_attempts",
-            "knockdowns": "knockdowns",
-            "punches landed": "punches_landed",
-            "rounds won": "rounds_won",
-            
-            # Golf
-            "birdies": "birdies",
-            "eagles": "eagles",
-            "pars": "pars",
-            "bogeys": "bogeys",
-            "driving distance": "driving_distance",
-            "fairways hit": "fairways_hit",
-            "greens in regulation": "greens_in_regulation",
-            "gir": "greens_in_regulation",
-            "putts": "putts",
-            
-            # Esports
-            "kills": "kills",
-            "deaths": "deaths",
-            "assists": "assists",
-            "maps won": "maps_won",
-            "rounds won": "rounds_won",
-            "damage": "damage",
-            "adr": "adr",
-            "kd ratio": "kd_ratio",
-            "kda": "kda"
-        }
-        
-        # Direct match first
-        if prop_lower in normalizations:
-            return normalizations[prop_lower]
+        # Direct match first, sport-specific aliases before the shared table
+        normalized = _SPORT_NORMALIZATIONS.get((sport, prop_lower)) or _NORMALIZATIONS.get(prop_lower)
+        if normalized:
+            return normalized
         
-        # Partial matches for complex props
-        for key, value in normalizations.items():
-            if key in prop_lower:
-                return value
+        # Partial matches for complex props: longest alias wins, ties go to the earlier entry
+        key = max(_find_words(_NORMALIZATION_MATCHER, prop_lower),
+                  key=lambda k: (len(k), -_NORMALIZATION_ORDER[k]), default=None)
+        if key is not None:
+            return _SPORT_NORMALIZATIONS.get((sport, key), _NORMALIZATIONS[key])
         
         # If no match found, create a normalized version
-        normalized = prop_lower.replace(" ", "_").replace("-", "_").replace("'", "").replace("+", "_plus_")
+        normalized = prop_lower.replace("+", "_plus_").translate(_PROP_TYPE_TRANSLATION)
         
         # Clean up multiple underscores
-        while "__" in normalized:
-            normalized = normalized.replace("__", "_")
-        
-        return normalized.strip("_")
+        return _MULTI_UNDERSCORE.sub("_", normalized).strip("_")
 
     def parse_csv_format(self, csv_text: str) -> List[Dict]:
         """Parse CSV format props"""
         props = []
-        lines = csv_text.strip().split('\n')
+        # csv.reader keeps quoted commas inside a field; blank lines come back as []
+        rows = list(csv.reader(io.StringIO(csv_text.strip()), skipinitialspace=True))
         # Skip header if present
-        if lines and any(header in lines[0].lower() for header in ['player', 'sport', 'prop']):
-            lines = lines[1:]
-        for line in lines:
-            if not line.strip():
-                continue
-            parts = [part.strip() for part in line.split(',')]
-            if len(parts) >= 4:
+        if rows and any(header in ','.join(rows[0]).lower() for header in self.CSV_HEADER_HINTS):
+            rows = rows[1:]
+        parsed_at = datetime.now().isoformat()
+        for row in rows:
+            if len(row) >= 4:
+                parts = [part.strip() for part in row]
                 prop = {
                     'player_name': parts[0],
-                    'sport': parts[1].upper() if len(parts) > 1 else 'UNKNOWN',
-                    'prop_type': parts[2] if len(parts) > 2 else '',
-                    'line_value': float(parts[3]) if len(parts) > 3 else 0,
+                    'sport': parts[1].upper(),
+                    'prop_type': parts[2],
+                    'line_value': float(parts[3]),
                     'odds_over': parts[4] if len(parts) > 4 else None,
                     'odds_under': parts[5] if len(parts) > 5 else None,
                     'opponent': parts[6] if len(parts) > 6 else None,
                     'game_date': parts[7] if len(parts) > 7 else None,
-                    'parsed_at': datetime.now().isoformat()
+                    'parsed_at': parsed_at
                 }
                 props.append(prop)
-                print(f"✅ CSV: {prop['player_name']} {prop['prop_type']} {prop['line_value']}")
+                log.debug("✅ CSV: %s %s %s", prop['player_name'], prop['prop_type'], prop['line_value'])
         return props
 
-    def validate_prop(self, prop: Dict) -> bool:
-        """Validate parsed prop data"""
-        required_fields = ['player_name', 'sport', 'prop_type', 'line_value']
-        for field in required_fields:
-            if not prop.get(field):
-                print(f"❌ Missing required field: {field}")
+    def validate_prop(self, prop) -> bool:
+        """Validate parsed prop data, given as a Prop or a prop dict"""
+        required_fields = ('player_name', 'sport', 'prop_type', 'line_value')
+        if isinstance(prop, Prop):
+            values = (prop.player_name, prop.sport, prop.prop_type, prop.line_value)
+        else:
+            values = tuple(prop.get(field) for field in required_fields)
+        for field, value in zip(required_fields, values):
+            if not value:
+                log.warning("❌ Missing required field: %s", field)
                 return False
         
-        if prop['line_value'] <= 0:
-            print(f"❌ Invalid line value: {prop['line_value']}")
+        line_value = values[3]
+        if line_value <= 0:
+            log.warning("❌ Invalid line value: %s", line_value)
             return False
             
         return True
@@ -402,7 +565,10 @@ class PropParser:
 
     def detect_format(self, input_text: str) -> str:
         """Auto-detect input format"""
-        if "," in input_text and input_text.count(",") > input_text.count(" "):
+        # A bounded prefix is enough to tell the formats apart on large pastes
+        sample = input_text[:self.FORMAT_SAMPLE_CHARS]
+        commas = sample.count(",")
+        if commas and commas > sample.count(" "):
             return "csv"
         else:
             return "standard"
@@ -414,9 +580,9 @@ class PropParser:
         if payout_multiplier:
             edge = prop.get('confidence_score', 0) - implied_prob
             if edge > 0:
-                print(f"🟢 +EV Bet! Your edge: {edge:.2%}")
+                log.info("🟢 +EV Bet! Your edge: %.2f%%", edge * 100)
             else:
-                print(f"🔴 No edge. Your edge: {edge:.2%}")
+                log.info("🔴 No edge. Your edge: %.2f%%", edge * 100)
         return {
             'implied_probability': implied_prob,
             'edge': edge
@@ -429,13 +595,31 @@ class PropParser:
         else:
             return -odds / (-odds + 100)
 
+    def calculate_implied_probabilities(self, odds) -> np.ndarray:
+        """Vectorized calculate_implied_probability over an array of American odds"""
+        odds = np.asarray(odds, dtype=np.float64)
+        # 100/(odds+100) for positive odds, -odds/(-odds+100) otherwise; both share |odds|+100
+        return np.where(odds > 0, 100.0, -odds) / (np.abs(odds) + 100.0)
+
+    def analyze_bets_batch(self, props: List[Dict], payout_multipliers, book_odds) -> List[Dict]:
+        """analyze_bet for many props at once; edge is None where there is no payout"""
+        implied = self.calculate_implied_probabilities(book_odds)
+        confidence = np.fromiter((prop.get('confidence_score', 0) for prop in props),
+                                 dtype=np.float64, count=len(props))
+        edges = confidence - implied
+        has_payout = [bool(payout) for payout in payout_multipliers]
+        return [
+            {'implied_probability': float(implied[i]), 'edge': float(edges[i]) if has_payout[i] else None}
+            for i in range(len(props))
+        ]
+
     def debug_parse(self, line: str) -> Dict:
         """Debug parsing - shows detailed breakdown"""
         print(f"\n🔍 DEBUG PARSING: '{line}'")
         print(f"Length: {len(line)} characters")
         
         # Test each pattern
-        for i, pattern in enumerate(self.patterns):
+        for i, pattern in enumerate(self.PATTERNS):
             match = pattern.match(line)
             if match:
                 print(f"✅ Pattern {i+1} matched!")
@@ -458,6 +642,7 @@ class PropParser:
 
 # Test the updated parser
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s')
     parser = PropParser()
     
     # Test cases
@@ -2,11 +2,25 @@ import requests
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+import threading
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor
 from config import Config
+from ttl_cache import TTLCache
+from data_fetcher import decode_json
+
+# Upper bound on in-flight API requests, shared by batch lookups
+MAX_CONCURRENT_REQUESTS = 4
+# Minimum spacing between request starts; only waits when calls come faster than this
+MIN_REQUEST_INTERVAL = 0.2
+# Player stats are reused for this many seconds
+STATS_CACHE_TTL = 300
 
 class RealDataFetcher:
+    # Per-game MLB stats averaged over the recent window, in game-dict key order
+    MLB_AVERAGED_STATS = ('hits', 'runs', 'rbis', 'home_runs', 'strikeouts')
+    
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({
@@ -20,9 +34,47 @@ class RealDataFetcher:
             'nfl': 'https://api.sportsdata.io/v3/nfl',
             'nhl': 'https://statsapi.web.nhl.com/api/v1'
         }
+        # Rate limiting: at most MAX_CONCURRENT_REQUESTS requests in flight at once
+        self._request_slots = threading.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._next_request_at = 0.0
+        self._rate_lock = threading.Lock()
+        self._stats_cache = TTLCache(maxsize=512, ttl=STATS_CACHE_TTL)
+        # Lowercased "first last" -> MLB player id, built once per season
+        self._mlb_name_index = {}
+        self._mlb_index_season = None
+        self._mlb_index_lock = threading.Lock()
+    
+    def _get(self, url, params=None):
+        """GET through the shared session, waiting for a free request slot and the rate gate"""
+        with self._request_slots:
+            # Reserve the next start time under the lock, then sleep outside it
+            with self._rate_lock:
+                now = time.monotonic()
+                wait = self._next_request_at - now
+                self._next_request_at = max(now, self._next_request_at) + MIN_REQUEST_INTERVAL
+            if wait > 0:
+                time.sleep(wait)
+            return self.session.get(url, params=params)
+    
+    def get_real_player_stats_batch(self, players, days=30):
+        """Fetch stats for many (player_name, sport) pairs concurrently, in input order"""
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            return list(executor.map(
+                lambda player: self.get_real_player_stats(player[0], player[1], days), players))
     
     def get_real_player_stats(self, player_name, sport, days=30):
-        """Get real player statistics from APIs"""
+        """Get real player statistics from APIs, reusing recent results"""
+        key = (player_name.lower(), sport.upper(), days)
+        stats = self._stats_cache.get(key)
+        if stats is None:
+            stats = self._fetch_real_player_stats(player_name, sport, days)
+            # Failed lookups come back empty and are retried next time
+            if stats:
+                self._stats_cache[key] = stats
+        return stats
+    
+    def _fetch_real_player_stats(self, player_name, sport, days):
+        """Fetch player statistics from the sport's API"""
         print(f"📊 Fetching real stats for {player_name} ({sport})")
         
         try:
@@ -42,29 +94,36 @@ class RealDataFetcher:
             print(f"❌ Error fetching real stats: {e}")
             return {}
     
+    def _mlb_player_index(self, season):
+        """Name -> id index of the season's MLB players, fetched on first use"""
+        with self._mlb_index_lock:
+            if self._mlb_index_season != season:
+                response = self._get(f"{self.apis['mlb']}/sports/1/players", params={'season': season})
+                
+                if response.status_code != 200:
+                    print(f"❌ MLB API error: {response.status_code}")
+                    return None
+                
+                index = {}
+                for player in decode_json(response).get('people', []):
+                    full_name = f"{player.get('firstName', '')} {player.get('lastName', '')}".lower()
+                    index.setdefault(full_name, player['id'])
+                self._mlb_name_index, self._mlb_index_season = index, season
+            return self._mlb_name_index
+    
     def get_mlb_stats_real(self, player_name, days):
         """Get real MLB stats from MLB API"""
         try:
             # Search for player
-            search_url = f"{self.apis['mlb']}/sports/1/players"
-            params = {'season': datetime.now().year}
-            
-            response = self.session.get(search_url, params=params)
-            time.sleep(0.5)  # Rate limiting
-            
-            if response.status_code != 200:
-                print(f"❌ MLB API error: {response.status_code}")
+            index = self._mlb_player_index(datetime.now().year)
+            if index is None:
                 return {}
             
-            data = response.json()
-            player_id = None
-            
-            # Find player by name
-            for player in data.get('people', []):
-                full_name = f"{player.get('firstName', '')} {player.get('lastName', '')}"
-                if player_name.lower() in full_name.lower():
-                    player_id = player['id']
-                    break
+            # Exact name first, then the first roster name containing it
+            name_lower = player_name.lower()
+            player_id = index.get(name_lower)
+            if player_id is None:
+                player_id = next((pid for full_name, pid in index.items() if name_lower in full_name), None)
             
             if not player_id:
                 print(f"❌ Player {player_name} not found in MLB API")
@@ -78,11 +137,10 @@ class RealDataFetcher:
                 'gameType': 'R'
             }
             
-            response = self.session.get(stats_url, params=params)
-            time.sleep(0.5)
+            response = self._get(stats_url, params=params)
             
             if response.status_code == 200:
-                stats_data = response.json()
+                stats_data = decode_json(response)
                 return self.parse_mlb_stats_real(stats_data, player_name)
             
             return {}
@@ -118,14 +176,12 @@ class RealDataFetcher:
             if games:
                 recent_games = games[-15:]  # Last 15 games
                 
-                averages = {
-                    'avg_hits': np.mean([g['hits'] for g in recent_games]),
-                    'avg_runs': np.mean([g['runs'] for g in recent_games]),
-                    'avg_rbis': np.mean([g['rbis'] for g in recent_games]),
-                    'avg_home_runs': np.mean([g['home_runs'] for g in recent_games]),
-                    'avg_strikeouts': np.mean([g['strikeouts'] for g in recent_games]),
-                    'games_played': len(recent_games)
-                }
+                # One (games, stats) matrix, averaged column-wise in a single pass
+                stat_matrix = np.array([[g[stat] for stat in self.MLB_AVERAGED_STATS] for g in recent_games],
+                                       dtype=np.float64)
+                averages = {f'avg_{stat}': mean
+                            for stat, mean in zip(self.MLB_AVERAGED_STATS, stat_matrix.mean(axis=0))}
+                averages['games_played'] = len(recent_games)
                 
                 return {
                     'player_name': player_name,
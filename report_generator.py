@@ -7,13 +7,11 @@ class ReportGenerator:
     
     def generate_daily_report(self):
         today = datetime.now().strftime('%Y-%m-%d')
-        props_df = self.db.get_recommended_props()
+        total_props = self.db.count_recommended_props()
         
-        if props_df.empty:
+        if not total_props:
             return f"📊 Daily Report - {today}\n\nNo props analyzed today."
         
-        total_props = len(props_df)
-        
         report = f"""📊 Daily Prop Analysis Report
 📅 Date: {today}
 
@@ -1,11 +1,22 @@
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
 from telegram import Update, ReplyKeyboardMarkup
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
 from config import Config
 from database_manager import DatabaseManager
 from prop_parser import PropParser
-from data_fetcher import DataFetcher
+from data_fetcher import MultiAPIDataFetcher
 from analysis_engine import AnalysisEngine
+from ttl_cache import TTLCache
+
+# uvloop is an optional, faster drop-in for the default asyncio event loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Enable logging
 logging.basicConfig(
@@ -14,31 +25,40 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class TelegramBot:
-    def __init__(self):
-        self.db = DatabaseManager()
-        self.parser = PropParser()
-        self.fetcher = DataFetcher()
-        self.analyzer = AnalysisEngine()
-    
-    async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Start command handler"""
-        keyboard = [
-            ['/sports', '/props'],
-            ['/analyze', '/help']
-        ]
-        reply_markup = ReplyKeyboardMarkup(keyboard, one_time_keyboard=True)
-        
-        await update.message.reply_text(
-            "🏆 Welcome to Multi-Sport Prop Bot!\\n\\n"
-            "I can help you analyze sports props across MLB, NFL, NBA, and more.\\n\\n"
-            "Use the commands below to get started:",
-            reply_markup=reply_markup
-        )
-    
-    async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Help command handler"""
-        help_text = """
+# Upper bound on player stats fetches in flight across all chats
+MAX_CONCURRENT_FETCHES = 4
+# Threads for the synchronous database, fetcher and analysis calls
+BLOCKING_WORKERS = 8
+# Seconds a fetched player's stats stay reusable across messages
+STATS_CACHE_TTL = 300
+# Upper bound on result replies in flight across all chats, below Telegram's
+# global limit of about 30 messages a second
+MAX_CONCURRENT_SENDS = 20
+# Telegram rejects messages over 4096 characters; leave headroom for Markdown
+MAX_REPLY_CHARS = 4000
+
+# Emoji based on recommendation
+_RECOMMENDATION_EMOJI = {
+    'STRONG_BET': '🔥',
+    'MODERATE_BET': '👍',
+    'WEAK_BET': '🤔',
+    'AVOID': '❌'
+}
+
+_RESULT_TEMPLATE = """{emoji} **Analysis Complete**
+
+**Player:** {player_name}
+**Prop:** {prop_type} {line_value}
+**Sport:** {sport}
+
+**📊 Results:**
+• Confidence: {confidence:.1f}%
+• Recommendation: {recommendation}
+
+**💡 Analysis Notes:**
+Based on available player statistics and recent performance trends."""
+
+_HELP_TEXT = """
 🤖 **Multi-Sport Prop Bot Commands**
 
 📊 **Analysis Commands:**
@@ -63,39 +83,88 @@ class TelegramBot:
 - Send multiple props at once (one per line)
 - Include odds when available
 - Use standard formats like "Player Over/Under X.X Stat +/-XXX"
-        """
-        await update.message.reply_text(help_text, parse_mode='Markdown')
+"""
+
+# Config.SUPPORTED_SPORTS is static, so the /sports reply is rendered once
+_SPORTS_TEXT = "🏆 **Supported Sports:**\n\n" + "\n\n".join(
+    f"**{sport_code}**\nProps: {', '.join(sport_info['prop_tabs'])}"
+    for sport_code, sport_info in Config.SUPPORTED_SPORTS.items()
+)
+
+class TelegramBot:
+    def __init__(self):
+        self.db = DatabaseManager()
+        self.parser = PropParser()
+        self.fetcher = MultiAPIDataFetcher()
+        self.analyzer = AnalysisEngine()
+        
+        # One queue and worker task per chat: messages within a chat are analyzed in
+        # order, while different chats run concurrently and never block polling
+        self._chat_queues: Dict[int, asyncio.Queue] = {}
+        self._chat_workers = set()  # strong references so running workers aren't collected
+        self._fetch_slots = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        self._send_slots = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+        self._pool = ThreadPoolExecutor(max_workers=BLOCKING_WORKERS, thread_name_prefix="propbet")
+        # SQLite allows one writer at a time, so writes queue on a single thread that
+        # owns them instead of parking pool threads on the database's write lock
+        self._db_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="propbet-db")
+        
+        # Player stats keyed on (player_name, sport); in-flight fetches are shared so
+        # several props for one player in a message cost a single request
+        self._stats_cache = TTLCache(maxsize=1024, ttl=STATS_CACHE_TTL)
+        self._stats_fetches: Dict[Tuple[str, str], asyncio.Task] = {}
+    
+    async def _run_blocking(self, func, *args):
+        """Run a synchronous call on the bot's thread pool without blocking the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(self._pool, func, *args)
+    
+    async def _run_db_write(self, func, *args):
+        """Run a database write on the dedicated writer thread"""
+        return await asyncio.get_running_loop().run_in_executor(self._db_writer, func, *args)
+    
+    async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Start command handler"""
+        keyboard = [
+            ['/sports', '/props'],
+            ['/analyze', '/help']
+        ]
+        reply_markup = ReplyKeyboardMarkup(keyboard, one_time_keyboard=True)
+        
+        await update.message.reply_text(
+            "🏆 Welcome to Multi-Sport Prop Bot!\n\n"
+            "I can help you analyze sports props across MLB, NFL, NBA, and more.\n\n"
+            "Use the commands below to get started:",
+            reply_markup=reply_markup
+        )
+    
+    async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Help command handler"""
+        await update.message.reply_text(_HELP_TEXT, parse_mode='Markdown')
     
     async def sports_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Sports command handler"""
-        sports_text = "🏆 **Supported Sports:**\\n\\n"
-        
-        for sport_code, sport_info in Config.SUPPORTED_SPORTS.items():
-            sports_text += f"**{sport_code}** - {sport_info['name']}\\n"
-            sports_text += f"Props: {', '.join(sport_info['prop_types'])}\\n\\n"
-        
-        await update.message.reply_text(sports_text, parse_mode='Markdown')
+        await update.message.reply_text(_SPORTS_TEXT, parse_mode='Markdown')
     
     async def props_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Props command handler"""
         # Get recommended props from database
-        recommended_props = self.db.get_recommended_props()
+        recommended_props = await self._run_blocking(self.db.get_recommended_props, 5)
         
-        if recommended_props.empty:
+        if not recommended_props:
             await update.message.reply_text(
-                "📊 No analyzed props available yet.\\n\\n"
+                "📊 No analyzed props available yet.\n\n"
                 "Send me some prop data to analyze!"
             )
             return
         
-        props_text = "🔥 **Today's Best Props:**\\n\\n"
-        
-        for _, prop in recommended_props.head(5).iterrows():
-            confidence = prop['confidence_score'] * 100
-            props_text += f"**{prop['player_name']}** ({prop['sport']})\\n"
-            props_text += f"{prop['prop_type'].title()}: {prop['line_value']}\\n"
-            props_text += f"Confidence: {confidence:.1f}%\\n"
-            props_text += f"Recommendation: {prop['recommendation']}\\n\\n"
+        # Only recommended props are listed; the table doesn't store the label itself
+        props_text = "🔥 **Today's Best Props:**\n\n" + "\n\n".join(
+            f"**{prop['player_name']}** ({prop['sport']})\n"
+            f"{prop['prop_type'].title()}: {prop['line_value']}\n"
+            f"Confidence: {prop['confidence_score'] * 100:.1f}%\n"
+            f"Recommendation: {prop.get('recommendation', 'RECOMMENDED')}"
+            for prop in recommended_props
+        )
         
         await update.message.reply_text(props_text, parse_mode='Markdown')
     
@@ -108,77 +177,138 @@ class TelegramBot:
         
         if not props:
             await update.message.reply_text(
-                "❌ I couldn't parse that prop format.\\n\\n"
+                "❌ I couldn't parse that prop format.\n\n"
                 "Try something like: 'Mike Trout Over 1.5 Hits +120'"
             )
             return
         
         await update.message.reply_text(f"🔍 Analyzing {len(props)} prop(s)...")
         
-        results = []
-        for prop in props:
-            # Add to database
-            prop_id = self.db.add_prop(prop)
-            prop['id'] = prop_id
-            
-            # Fetch player stats
-            player_stats = self.fetcher.fetch_player_stats(
-                prop['player_name'], 
-                prop['sport']
-            )
-            
-            # Analyze the prop
-            analysis = self.analyzer.analyze_prop(prop, player_stats)
-            results.append(analysis)
+        # Hand the slow part to the chat's worker so this handler returns right away
+        chat_id = update.effective_chat.id
+        queue = self._chat_queues.get(chat_id)
+        if queue is None:
+            queue = self._chat_queues[chat_id] = asyncio.Queue()
+            worker = asyncio.create_task(self._chat_worker(chat_id, queue))
+            self._chat_workers.add(worker)
+            worker.add_done_callback(self._chat_workers.discard)
+        queue.put_nowait((update, props))
+    
+    async def _chat_worker(self, chat_id: int, queue: asyncio.Queue):
+        """Analyze one chat's queued messages in order, exiting once the queue drains"""
+        while True:
+            update, props = await queue.get()
+            try:
+                await self.analyze_props(update, props)
+            except Exception:
+                logger.exception("Prop analysis failed for chat %s", chat_id)
+            finally:
+                queue.task_done()
             
-            # Update database with analysis
-            self.db.update_prop_analysis(prop_id, {
-                'recommended': analysis.get('recommendation') in ['STRONG_BET', 'MODERATE_BET'],
-                'confidence_score': analysis.get('confidence_score', 0),
-                'expected_value': 0  # Placeholder
-            })
+            # No await between the check and the delete, so no message can slip in
+            if queue.empty():
+                del self._chat_queues[chat_id]
+                return
+    
+    async def analyze_props(self, update: Update, props: list):
+        """Store, analyze and reply to one message's props"""
+        # Add all of the message's props to the database in one transaction
+        prop_ids = await self._run_db_write(self.db.add_props_bulk, props)
+        for prop, prop_id in zip(props, prop_ids):
+            prop['id'] = prop_id
+        
+        # The message's props are analyzed concurrently; gather keeps their order, and
+        # a prop that fails is reported on its own instead of sinking the whole message
+        results = await asyncio.gather(*(self.analyze_prop(prop) for prop in props), return_exceptions=True)
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.error("Analysis failed for %s: %s", props[i]['player_name'], result)
+                results[i] = {'error': str(result)}
+        
+        analysis_rows = [
+            (prop['id'],
+             analysis.get('recommendation') in ['STRONG_BET', 'MODERATE_BET'],
+             analysis.get('confidence_score', 0))
+            for prop, analysis in zip(props, results)
+        ]
+        
+        # Update database with all analyses in one transaction
+        await self._run_db_write(self.db.update_prop_analyses_bulk, analysis_rows)
         
         # Send results
         await self.send_analysis_results(update, results)
     
+    async def analyze_prop(self, prop: dict) -> dict:
+        """Fetch one prop's player stats and analyze it, off the event loop"""
+        player_stats = await self.get_player_stats(prop['player_name'], prop['sport'])
+        
+        # Analyze the prop
+        return await self._run_blocking(self.analyzer.analyze_prop, prop, player_stats)
+    
+    async def get_player_stats(self, player_name: str, sport: str) -> dict:
+        """Fetch player stats, reusing a recent or in-flight fetch for the same player"""
+        key = (player_name, sport)
+        player_stats = self._stats_cache.get(key)
+        if player_stats is not None:
+            return player_stats
+        
+        fetch = self._stats_fetches.get(key)
+        if fetch is None:
+            fetch = self._stats_fetches[key] = asyncio.create_task(self._fetch_player_stats(key))
+            fetch.add_done_callback(lambda _: self._stats_fetches.pop(key, None))
+        # Shielded so one cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(fetch)
+    
+    async def _fetch_player_stats(self, key: Tuple[str, str]) -> dict:
+        """Fetch one player's stats on the thread pool and cache a non-empty result"""
+        async with self._fetch_slots:
+            player_stats = await self._run_blocking(self.fetcher.fetch_player_stats, *key)
+        if player_stats:
+            self._stats_cache[key] = player_stats
+        return player_stats
+    
     async def send_analysis_results(self, update: Update, results: list):
-        """Send analysis results to user"""
+        """Send analysis results to user, batched into as few messages as possible"""
+        blocks = []
         for analysis in results:
             if 'error' in analysis:
-                await update.message.reply_text(f"❌ Analysis error: {analysis['error']}")
+                blocks.append(f"❌ Analysis error: {analysis['error']}")
                 continue
             
-            confidence = analysis['confidence_score'] * 100
             recommendation = analysis['recommendation']
-            
-            # Emoji based on recommendation
-            emoji_map = {
-                'STRONG_BET': '🔥',
-                'MODERATE_BET': '👍',
-                'WEAK_BET': '🤔',
-                'AVOID': '❌'
-            }
-            emoji = emoji_map.get(recommendation, '📊')
-            
-            result_text = f"""
-{emoji} **Analysis Complete**
-
-**Player:** {analysis['player_name']}
-**Prop:** {analysis['prop_type'].title()} {analysis['line_value']}
-**Sport:** {analysis.get('sport', 'Unknown')}
-
-**📊 Results:**
-• Confidence: {confidence:.1f}%
-• Recommendation: {recommendation}
-
-**💡 Analysis Notes:**
-Based on available player statistics and recent performance trends.
-            """
-            
-            await update.message.reply_text(result_text, parse_mode='Markdown')
+            blocks.append(_RESULT_TEMPLATE.format(
+                emoji=_RECOMMENDATION_EMOJI.get(recommendation, '📊'),
+                player_name=analysis['player_name'],
+                prop_type=analysis['prop_type'].title(),
+                line_value=analysis['line_value'],
+                sport=analysis.get('sport', 'Unknown'),
+                confidence=analysis['confidence_score'] * 100,
+                recommendation=recommendation
+            ))
+        
+        # Split only on block boundaries so no single result is cut in half.
+        # A chat's parts go out in order (and within its ~1 msg/sec limit), so
+        # round-trips overlap across chats, whose workers run concurrently
+        parts, current, current_len = [], [], 0
+        for block in blocks:
+            if current and current_len + 2 + len(block) > MAX_REPLY_CHARS:
+                parts.append("\n\n".join(current))
+                current, current_len = [], 0
+            current_len += len(block) + (2 if current else 0)
+            current.append(block)
+        if current:
+            parts.append("\n\n".join(current))
+        
+        for part in parts:
+            async with self._send_slots:
+                await update.message.reply_text(part, parse_mode='Markdown')
     
     def run(self):
         """Run the telegram bot"""
+        # Must be set before the application creates its event loop
+        if UVLOOP_AVAILABLE:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        
         # Create application
         application = Application.builder().token(Config.TELEGRAM_BOT_TOKEN).build()
         
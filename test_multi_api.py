@@ -5,19 +5,30 @@ Simple test for multi-API PrizePicks workflow
 
 import sys
 import os
+from collections import Counter
 from datetime import datetime
 
+import numpy as np
+
 # Add current directory to path
 sys.path.insert(0, os.getcwd())
 
 try:
-    from analysis_engine import WagerBrainAnalysisEngine
+    from analysis_engine import WagerBrainAnalysisEngine, compute_slips
     from prop_parser import PropParser
     print("✅ Core modules imported successfully")
 except ImportError as e:
     print(f"❌ Import error: {e}")
     sys.exit(1)
 
+# Slip probability tier edges: a probability above an edge moves up one tier
+_SLIP_PROBABILITY_EDGES = np.array([0.2, 0.3])
+# Estimated payout multiplier per tier, keyed by number of picks
+_SLIP_MULTIPLIERS = {3: np.array([12.0, 8.0, 6.0])}
+_DEFAULT_SLIP_MULTIPLIERS = np.full(len(_SLIP_PROBABILITY_EDGES) + 1, 5.0)
+# Below this all-hit probability no multiplier makes a slip worth playing
+MIN_SLIP_PROBABILITY = 1e-4
+
 def test_basic_analysis():
     """Test basic analysis with existing modules"""
     print("\n🎯 Testing Basic Multi-Prop Analysis")
@@ -93,48 +104,29 @@ def analyze_slip(results):
     print(f"\n🎯 SLIP ANALYSIS")
     print("="*30)
     
-    # Calculate slip probability (all must hit)
-    slip_probability = 1.0
-    total_expected_value = 0
-    
-    recommendations = []
-    for result in results:
-        true_prob = result['wagerbrain_analysis']['true_probability']
-        bet_type = result.get('bet_type', 'over')
-        
-        # Adjust probability based on bet type
-        if bet_type == 'over':
-            pick_prob = true_prob
-        else:
-            pick_prob = 1 - true_prob
-            
-        slip_probability *= pick_prob
-        total_expected_value += result['wagerbrain_analysis']['expected_value']
-        recommendations.append(result['recommendation'])
+    true_probs = np.array([r['wagerbrain_analysis']['true_probability'] for r in results], dtype=np.float64)
+    bet_is_over = np.array([r.get('bet_type', 'over') == 'over' for r in results])
+    total_expected_value = sum(r['wagerbrain_analysis']['expected_value'] for r in results)
+    recommendation_counts = Counter(r['recommendation'] for r in results)
+    strong_bets = recommendation_counts['STRONG_BET']
+    moderate_bets = recommendation_counts['MODERATE_BET']
+    avoid_bets = recommendation_counts['AVOID'] + recommendation_counts['STRONG_AVOID']
     
-    # Estimate multiplier (3-pick slip)
+    # Slip probability (all must hit) picks the multiplier tier (tiered for 3-pick slips)
     entry_count = len(results)
-    if entry_count == 3:
-        if slip_probability > 0.3:
-            multiplier = 6.0
-        elif slip_probability > 0.2:
-            multiplier = 8.0
-        else:
-            multiplier = 12.0
-    else:
-        multiplier = 5.0  # Default
-    
-    # Calculate expected payout
     stake = 1.0
-    expected_payout = slip_probability * multiplier * stake
-    slip_expected_value = expected_payout - stake
-    
-    # Generate recommendation
-    strong_bets = recommendations.count('STRONG_BET')
-    moderate_bets = recommendations.count('MODERATE_BET')
-    avoid_bets = recommendations.count('AVOID') + recommendations.count('STRONG_AVOID')
-    
-    if avoid_bets > 0:
+    slip_probabilities, multipliers, expected_values = compute_slips(
+        true_probs.reshape(1, -1), bet_is_over.reshape(1, -1),
+        _SLIP_PROBABILITY_EDGES, _SLIP_MULTIPLIERS.get(entry_count, _DEFAULT_SLIP_MULTIPLIERS), stake
+    )
+    slip_probability = float(slip_probabilities[0])
+    multiplier = float(multipliers[0])
+    slip_expected_value = float(expected_values[0])
+    expected_payout = slip_expected_value + stake
+    
+    # Generate recommendation; an avoided pick or a near-impossible slip settles it
+    # before any of the EV tiers are considered
+    if avoid_bets > 0 or slip_probability < MIN_SLIP_PROBABILITY:
         slip_recommendation = "AVOID_SLIP"
     elif slip_expected_value > 0.15 and strong_bets >= 2:
         slip_recommendation = "STRONG_PLAY"
@@ -0,0 +1,73 @@
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from database_manager import DatabaseManager
+
+
+def make_prop(i):
+    return {
+        'sport': 'MLB',
+        'player_name': f"Player {i}",
+        'prop_type': 'hits',
+        'line_value': 0.5 + i,
+        'bet_type': 'over' if i % 2 else 'under',
+        'odds': '+120',
+        'raw_input': f"Player {i} Over {0.5 + i} Hits +120"
+    }
+
+
+class TestDatabaseManager(unittest.TestCase):
+    def setUp(self):
+        self._saved_paths = (Config.DATABASE_PATH, Config.PROPS_DB, Config.STATS_DB)
+        self.db_dir = tempfile.mkdtemp()
+        Config.DATABASE_PATH = self.db_dir
+        Config.PROPS_DB = os.path.join(self.db_dir, "props.db")
+        Config.STATS_DB = os.path.join(self.db_dir, "player_stats.db")
+        self.db = DatabaseManager()
+
+    def tearDown(self):
+        self.db.close_all()
+        Config.DATABASE_PATH, Config.PROPS_DB, Config.STATS_DB = self._saved_paths
+        shutil.rmtree(self.db_dir, ignore_errors=True)
+
+    def fetch_rows(self, ids):
+        with sqlite3.connect(Config.PROPS_DB) as conn:
+            rows = dict(
+                (row[0], row[1:])
+                for row in conn.execute("SELECT id, player_name, line_value, bet_type FROM props")
+            )
+        return [rows[prop_id] for prop_id in ids]
+
+    def test_add_props_bulk_returns_ids_in_input_order(self):
+        """Test bulk insert ids point at the rows of the matching input props"""
+        props = [make_prop(i) for i in range(25)]
+        ids = self.db.add_props_bulk(props)
+
+        self.assertEqual(len(ids), len(props))
+        self.assertEqual(len(set(ids)), len(ids))
+        expected = [(p['player_name'], p['line_value'], p['bet_type']) for p in props]
+        self.assertEqual(self.fetch_rows(ids), expected)
+
+    def test_add_props_bulk_after_other_inserts(self):
+        """Test ids stay correct when rows already exist before the bulk insert"""
+        first_id = self.db.add_prop(make_prop(100))
+        ids = self.db.add_props_bulk(make_prop(i) for i in range(5))
+
+        self.assertTrue(all(prop_id > first_id for prop_id in ids))
+        self.assertEqual([row[0] for row in self.fetch_rows(ids)], [f"Player {i}" for i in range(5)])
+
+    def test_add_props_bulk_empty(self):
+        """Test an empty batch inserts nothing"""
+        self.assertEqual(self.db.add_props_bulk([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,82 +9,34 @@ from prop_parser import PropParser
 from config import Config
 
 class TestPropParser(unittest.TestCase):
-    def setUp(self):
-        self.parser = PropParser()
+    # (input, player, sport, prop_type, line_value, bet_type)
+    SINGLE_PROP_CASES = (
+        ("Mike Trout Over 1.5 Hits +120", "Mike Trout", "MLB", "hits", 1.5, "over"),
+        ("Patrick Mahomes Over 275.5 Passing Yards +110", "Patrick Mahomes", "NFL", "passing_yards", 275.5, "over"),
+        ("LeBron James Under 25.5 Points -110", "LeBron James", "NBA", "points", 25.5, "under"),
+        ("Connor McDavid Over 0.5 Goals +150", "Connor McDavid", "NHL", "goals", 0.5, "over"),
+        ("Jon Jones Over 2.5 Takedowns +200", "Jon Jones", "MMA", "takedowns", 2.5, "over"),
+        ("Tiger Woods Over 3.5 Birdies -120", "Tiger Woods", "GOLF", "birdies", 3.5, "over"),
+        ("Jalen Hurts O 1.5 Rushing TD", "Jalen Hurts", "NFL", "touchdowns", 1.5, "over"),
+    )
     
-    def test_parse_mlb_prop(self):
-        """Test parsing MLB prop"""
-        input_text = "Mike Trout Over 1.5 Hits +120"
-        props = self.parser.parse_manual_input(input_text)
-        
-        self.assertEqual(len(props), 1)
-        prop = props[0]
-        self.assertEqual(prop['player_name'], "Mike Trout")
-        self.assertEqual(prop['sport'], "MLB")
-        self.assertEqual(prop['prop_type'], "hits")
-        self.assertEqual(prop['line_value'], 1.5)
-        self.assertEqual(prop['bet_type'], "over")
-    
-    def test_parse_nfl_prop(self):
-        """Test parsing NFL prop"""
-        input_text = "Patrick Mahomes Over 275.5 Passing Yards +110"
-        props = self.parser.parse_manual_input(input_text)
-        
-        self.assertEqual(len(props), 1)
-        prop = props[0]
-        self.assertEqual(prop['player_name'], "Patrick Mahomes")
-        self.assertEqual(prop['sport'], "NFL")
-        self.assertEqual(prop['prop_type'], "passing_yards")
-        self.assertEqual(prop['line_value'], 275.5)
-    
-    def test_parse_nba_prop(self):
-        """Test parsing NBA prop"""
-        input_text = "LeBron James Under 25.5 Points -110"
-        props = self.parser.parse_manual_input(input_text)
-        
-        self.assertEqual(len(props), 1)
-        prop = props[0]
-        self.assertEqual(prop['player_name'], "LeBron James")
-        self.assertEqual(prop['sport'], "NBA")
-        self.assertEqual(prop['prop_type'], "points")
-        self.assertEqual(prop['line_value'], 25.5)
-        self.assertEqual(prop['bet_type'], "under")
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = PropParser()
     
-    def test_parse_nhl_prop(self):
-        """Test parsing NHL prop"""
-        input_text = "Connor McDavid Over 0.5 Goals +150"
-        props = self.parser.parse_manual_input(input_text)
-        
-        self.assertEqual(len(props), 1)
-        prop = props[0]
-        self.assertEqual(prop['player_name'], "Connor McDavid")
-        self.assertEqual(prop['sport'], "NHL")
-        self.assertEqual(prop['prop_type'], "goals")
-        self.assertEqual(prop['line_value'], 0.5)
-    
-    def test_parse_mma_prop(self):
-        """Test parsing MMA prop"""
-        input_text = "Jon Jones Over 2.5 Takedowns +200"
-        props = self.parser.parse_manual_input(input_text)
-        
-        self.assertEqual(len(props), 1)
-        prop = props[0]
-        self.assertEqual(prop['player_name'], "Jon Jones")
-        self.assertEqual(prop['sport'], "MMA")
-        self.assertEqual(prop['prop_type'], "takedowns")
-        self.assertEqual(prop['line_value'], 2.5)
-    
-    def test_parse_golf_prop(self):
-        """Test parsing Golf prop"""
-        input_text = "Tiger Woods Over 3.5 Birdies -120"
-        props = self.parser.parse_manual_input(input_text)
-        
-        self.assertEqual(len(props), 1)
-        prop = props[0]
-        self.assertEqual(prop['player_name'], "Tiger Woods")
-        self.assertEqual(prop['sport'], "GOLF")
-        self.assertEqual(prop['prop_type'], "birdies")
-        self.assertEqual(prop['line_value'], 3.5)
+    def test_parse_single_props(self):
+        """Test parsing one prop per sport"""
+        for input_text, player, sport, prop_type, line_value, bet_type in self.SINGLE_PROP_CASES:
+            with self.subTest(input_text=input_text):
+                props = self.parser.parse_manual_input(input_text)
+                
+                self.assertEqual(len(props), 1)
+                prop = props[0]
+                self.assertEqual(prop['player_name'], player)
+                self.assertEqual(prop['sport'], sport)
+                self.assertEqual(prop['prop_type'], prop_type)
+                self.assertEqual(prop['line_value'], line_value)
+                self.assertEqual(prop['bet_type'], bet_type)
     
     def test_parse_multiple_props(self):
         """Test parsing multiple props"""
@@ -0,0 +1,135 @@
+import asyncio
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+
+TELEGRAM_AVAILABLE = importlib.util.find_spec('telegram') is not None
+
+
+class FakeMessage:
+    """Stands in for telegram.Message, recording every reply"""
+
+    def __init__(self, text):
+        self.text = text
+        self.replies = []
+
+    async def reply_text(self, text, **kwargs):
+        self.replies.append(text)
+
+
+def fake_update(text, chat_id=1):
+    return SimpleNamespace(message=FakeMessage(text), effective_chat=SimpleNamespace(id=chat_id))
+
+
+class FakeFetcher:
+    """Returns canned stats instead of calling the sports APIs"""
+
+    def __init__(self):
+        self.calls = []
+
+    def fetch_player_stats(self, player_name, sport):
+        self.calls.append((player_name, sport))
+        return {
+            'recent_averages': {},
+            'games_played': 15,
+            'total_games': 30,
+            'data_source': 'test'
+        }
+
+
+@unittest.skipUnless(TELEGRAM_AVAILABLE, "python-telegram-bot is not installed")
+class TestTelegramBot(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._saved_paths = (Config.DATABASE_PATH, Config.PROPS_DB, Config.STATS_DB)
+        cls.db_dir = tempfile.mkdtemp()
+        Config.DATABASE_PATH = cls.db_dir
+        Config.PROPS_DB = os.path.join(cls.db_dir, "props.db")
+        Config.STATS_DB = os.path.join(cls.db_dir, "player_stats.db")
+
+        import telegram_bot
+        cls.telegram_bot = telegram_bot
+
+    @classmethod
+    def tearDownClass(cls):
+        from database_manager import DatabaseManager
+        DatabaseManager().close_all()
+        Config.DATABASE_PATH, Config.PROPS_DB, Config.STATS_DB = cls._saved_paths
+        shutil.rmtree(cls.db_dir, ignore_errors=True)
+
+    def setUp(self):
+        self.bot = self.telegram_bot.TelegramBot()
+        self.bot.fetcher = FakeFetcher()
+
+    async def _handle(self, update):
+        await self.bot.handle_message(update, None)
+        await asyncio.gather(*self.bot._chat_workers)
+
+    def test_handle_message_analyzes_and_replies(self):
+        """Test a multi-prop message is stored, analyzed and answered in one reply"""
+        update = fake_update("Mike Trout Over 1.5 Hits +120\nLeBron James Under 25.5 Points -110")
+        asyncio.run(self._handle(update))
+
+        replies = update.message.replies
+        self.assertEqual(len(replies), 2)
+        self.assertIn("Analyzing 2 prop(s)", replies[0])
+        self.assertIn("Mike Trout", replies[1])
+        self.assertIn("LeBron James", replies[1])
+        self.assertLess(replies[1].index("Mike Trout"), replies[1].index("LeBron James"))
+        self.assertEqual(self.bot._chat_queues, {})
+        self.assertTrue(self.bot.db.get_unanalyzed_props().empty)
+
+    def test_handle_message_rejects_unparseable_text(self):
+        """Test a message with no props gets the format hint and no analysis"""
+        update = fake_update("hello there")
+        asyncio.run(self._handle(update))
+
+        self.assertEqual(len(update.message.replies), 1)
+        self.assertIn("couldn't parse", update.message.replies[0])
+        self.assertNotIn("\\n", update.message.replies[0])
+        self.assertEqual(self.bot.fetcher.calls, [])
+
+    def test_analyze_props_fetches_each_player_once(self):
+        """Test props for the same player share one stats fetch"""
+        update = fake_update("")
+        props = self.bot.parser.parse_manual_input(
+            "Mike Trout Over 1.5 Hits +120\nMike Trout Over 0.5 Home Runs +300"
+        )
+        asyncio.run(self.bot.analyze_props(update, props))
+
+        self.assertEqual(self.bot.fetcher.calls, [("Mike Trout", "MLB")])
+        self.assertEqual(len(update.message.replies), 1)
+
+    def test_send_analysis_results_splits_on_block_boundaries(self):
+        """Test long result sets split under the reply limit without cutting a result"""
+        analysis = {
+            'player_name': 'Mike Trout',
+            'prop_type': 'hits',
+            'line_value': 1.5,
+            'sport': 'MLB',
+            'confidence_score': 0.7,
+            'recommendation': 'STRONG_BET'
+        }
+        results = [dict(analysis) for _ in range(40)] + [{'error': 'no stats'}]
+        update = fake_update("")
+        asyncio.run(self.bot.send_analysis_results(update, results))
+
+        replies = update.message.replies
+        self.assertGreater(len(replies), 1)
+        for reply in replies:
+            self.assertLessEqual(len(reply), self.telegram_bot.MAX_REPLY_CHARS)
+        self.assertEqual(sum(reply.count("Analysis Complete") for reply in replies), 40)
+        self.assertIn("❌ Analysis error: no stats", replies[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
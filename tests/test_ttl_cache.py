@@ -0,0 +1,81 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ttl_cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch('ttl_cache.time.monotonic', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_and_set(self):
+        """Test stored values come back and missing keys use the default"""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache[('Mike Trout', 'MLB')] = {'hits': 1.2}
+
+        self.assertEqual(cache.get(('Mike Trout', 'MLB')), {'hits': 1.2})
+        self.assertEqual(cache[('Mike Trout', 'MLB')], {'hits': 1.2})
+        self.assertIn(('Mike Trout', 'MLB'), cache)
+        self.assertIsNone(cache.get('missing'))
+        self.assertEqual(cache.get('missing', 'default'), 'default')
+        with self.assertRaises(KeyError):
+            cache['missing']
+        self.assertEqual(len(cache), 1)
+
+    def test_entries_expire_after_ttl(self):
+        """Test an entry is dropped once its ttl has passed"""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache['key'] = 'value'
+
+        self.now += 59
+        self.assertEqual(cache.get('key'), 'value')
+        self.now += 1
+        self.assertIsNone(cache.get('key'))
+        self.assertNotIn('key', cache)
+        self.assertEqual(len(cache), 0)
+
+    def test_setting_a_key_again_restarts_its_ttl(self):
+        """Test overwriting an entry gives it a fresh ttl"""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache['key'] = 'old'
+        self.now += 50
+        cache['key'] = 'new'
+        self.now += 50
+
+        self.assertEqual(cache.get('key'), 'new')
+
+    def test_least_recently_used_is_evicted_at_maxsize(self):
+        """Test the cache holds maxsize entries and evicts the least recently used"""
+        cache = TTLCache(maxsize=3, ttl=60)
+        for key in 'abc':
+            cache[key] = key.upper()
+
+        # Reading 'a' makes 'b' the least recently used
+        cache.get('a')
+        cache['d'] = 'D'
+
+        self.assertEqual(len(cache), 3)
+        self.assertNotIn('b', cache)
+        for key in 'acd':
+            self.assertEqual(cache.get(key), key.upper())
+
+    def test_clear(self):
+        """Test clear empties the cache"""
+        cache = TTLCache(maxsize=3, ttl=60)
+        cache['a'] = 1
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.get('a'))
+
+
+if __name__ == '__main__':
+    unittest.main()